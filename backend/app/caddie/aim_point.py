@@ -95,24 +95,22 @@ def classify_pin_position(
 
     Without pin coordinates, we classify based on hazard proximity.
     """
-    if not hole.hazards:
-        return "green"
-
-    # Count severe hazards close to the green
-    severe_close = [
-        h for h in hole.hazards
-        if h.penalty_severity in ("severe", "death")
-        and h.distance_from_green <= 10
-    ]
-
-    if len(severe_close) >= 2:
-        return "red"
-    elif len(severe_close) == 1:
-        return "yellow"
+    # One pass: count severe hazards close to the green (two is already red,
+    # so stop there) and note any death hazard along the way.
+    severe_close = 0
+    has_death = False
+    for h in hole.hazards:
+        severity = h.penalty_severity
+        if severity == "death":
+            has_death = True
+        elif severity != "severe":
+            continue
+        if h.distance_from_green <= 10:
+            severe_close += 1
+            if severe_close >= 2:
+                return "red"
 
-    # Any death hazards nearby
-    death_hazards = [h for h in hole.hazards if h.penalty_severity == "death"]
-    if death_hazards:
+    if severe_close == 1 or has_death:
         return "yellow"
 
     return "green"
@@ -353,6 +351,16 @@ _SPOKEN_SIDE_WORD: dict[str, str] = {
 }
 
 
+# compute_miss_side's per-side hazard-type bitmask. Bits are read back in
+# this order, so the spoken "water, bunker" order never depends on which
+# hazard was seen first; any other type only marks the side as "trouble".
+_MISS_TYPE_BITS: dict[str, int] = {"water": 1, "bunker": 2, "ob": 4, "trees": 8}
+_MISS_TYPE_OTHER: int = 16
+_MISS_TYPE_WORDS: tuple[tuple[int, str], ...] = (
+    (1, "water"), (2, "bunker"), (4, "OB"), (8, "trees"),
+)
+
+
 def compute_miss_side(
     hole: HoleIntelligence,
     player_stats: Optional[PlayerStatistics],
@@ -384,29 +392,22 @@ def compute_miss_side(
         and max(0, hole.yards - distance_yards) >= APPROACH_FRAME_MIN_TEE_OFFSET_YDS
     )
 
-    # Classify each side's penalty
-    side_severity: dict[str, list[str]] = {
-        "left": [],
-        "right": [],
-        "front": [],
-        "back": [],
-    }
-
+    # One pass over the greenside hazards: each side's worst severity and a
+    # bitmask of the hazard types on it (read back by side_hazard_desc).
+    side_score = {"left": 0, "right": 0, "front": 0, "back": 0}
+    side_types = {"left": 0, "right": 0, "front": 0, "back": 0}
     for h in hole.hazards:
-        if h.side in side_severity and h.distance_from_green <= 20:
-            side_severity[h.side].append(h.penalty_severity)
-
-    # Find worst and best sides
-    def severity_score(severities: list[str]) -> float:
-        scores = {"mild": 1, "moderate": 2, "severe": 3, "death": 5}
-        if not severities:
-            return 0
-        return max(scores.get(s, 0) for s in severities)
-
-    left_score = severity_score(side_severity["left"])
-    right_score = severity_score(side_severity["right"])
-    front_score = severity_score(side_severity["front"])
-    back_score = severity_score(side_severity["back"])
+        side = h.side
+        if side in side_score and h.distance_from_green <= 20:
+            rank = _SEVERITY_RANK.get(h.penalty_severity, 0)
+            if rank > side_score[side]:
+                side_score[side] = rank
+            side_types[side] |= _MISS_TYPE_BITS.get(h.type, _MISS_TYPE_OTHER)
+
+    left_score = side_score["left"]
+    right_score = side_score["right"]
+    front_score = side_score["front"]
+    back_score = side_score["back"]
 
     # Determine preferred miss direction (lowest penalty)
     lr_options = []
@@ -439,22 +440,10 @@ def compute_miss_side(
 
     # Build descriptions
     def side_hazard_desc(side: str) -> str:
-        hazards_on_side = [
-            h for h in hole.hazards
-            if h.side == side and h.distance_from_green <= 20
-        ]
-        if not hazards_on_side:
+        types = side_types.get(side, 0)
+        if not types:
             return "open"
-        types = set(h.type for h in hazards_on_side)
-        parts = []
-        if "water" in types:
-            parts.append("water")
-        if "bunker" in types:
-            parts.append("bunker")
-        if "ob" in types:
-            parts.append("OB")
-        if "trees" in types:
-            parts.append("trees")
+        parts = [word for bit, word in _MISS_TYPE_WORDS if types & bit]
         return ", ".join(parts) if parts else "trouble"
 
     preferred_desc_suffix = side_hazard_desc(
@@ -1160,6 +1149,11 @@ def _select_club_expected_strokes(
     )
 
 
+# A shot from at least this fraction of the hole's card yardage is treated as
+# the tee shot (DECADE "moderate" bias); anything shorter is an approach.
+_TEE_SHOT_FRACTION: float = 0.85
+
+
 def generate_recommendation(
     hole: HoleIntelligence,
     distance_yards: int,
@@ -1203,7 +1197,7 @@ def generate_recommendation(
     # DECADE bias: conservative for approach shots, moderate for tee shots.
     # hole.yards is None when yardage is unknown (no fake fallback) — treat
     # as an approach shot (conservative) rather than crashing on None * 0.85.
-    is_tee_shot = hole.yards is not None and distance_yards >= hole.yards * 0.85
+    is_tee_shot = hole.yards is not None and distance_yards >= hole.yards * _TEE_SHOT_FRACTION
     bias = "moderate" if is_tee_shot else "conservative"
     club, club_dist = select_club(adjusted_yards, clubs, bias=bias)
 
@@ -1425,10 +1419,9 @@ def generate_recommendation(
     if competition_legal:
         _r.append((1, "Competition-legal mode: distance adjustments disabled (USGA conforming)"))
     elif adjustments:
-        adj_summary = ", ".join(
-            f"{a.type}: {'+' if a.yards > 0 else ''}{a.yards}y"
-            for a in adjustments
-        )
+        # compute_adjustments only emits non-zero factors, so the `+` format
+        # spec signs every entry exactly like the old conditional prefix.
+        adj_summary = ", ".join([f"{a.type}: {a.yards:+d}y" for a in adjustments])
         _r.append((4, f"Distance adjustments: {adj_summary}"))
 
     # P4 — adjusted distance note (color; the club line already shows the adjusted yards)
@@ -1484,7 +1477,7 @@ def generate_recommendation(
         # P1 — driving-zone DECADE landing advice + any dead-ahead cross hazard.
         if landing_advice:
             _r.append((1, landing_advice))
-        cross_line = cross_hazard_line(zone, float(club_dist), CLUB_DISPLAY_NAMES.get(club, club))
+        cross_line = cross_hazard_line(zone, float(club_dist), display_name)
         if cross_line:
             _r.append((1, cross_line))
         # P2 — fairway-bend-in-window line (honest reuse of HoleBend; omitted
@@ -1600,17 +1593,16 @@ def generate_recommendation(
     else:
         aggressiveness = "conservative" if any(h.penalty_severity == "death" for h in zone) else "moderate"
 
-    # Confidence based on data quality
-    confidence = 0.5
-    if weather:
-        confidence += 0.15
-    if hole.elevation_change_ft != 0:
-        confidence += 0.1
-    if player_stats and player_stats.rounds_analyzed > 5:
-        confidence += 0.15
-    if hole.hazards:
-        confidence += 0.1
-    confidence = min(confidence, 0.95)
+    # Confidence based on data quality (terms summed in the original order,
+    # so the float result is unchanged)
+    confidence = min(
+        0.5
+        + 0.15 * bool(weather)
+        + 0.1 * (hole.elevation_change_ft != 0)
+        + 0.15 * bool(player_stats and player_stats.rounds_analyzed > 5)
+        + 0.1 * bool(hole.hazards),
+        0.95,
+    )
 
     return CaddieRecommendation(
         club=club,
@@ -11,6 +11,8 @@ and `get_shot_distance` can never disagree within a single caddie turn.
 """
 
 import logging
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional
 
 from app.caddie import physics
@@ -55,6 +57,17 @@ CLUB_DISPLAY_NAMES: dict[str, str] = {
     "lw": "LW",
 }
 
+
+def format_club_distances(club_distances: dict[str, int]) -> str:
+    """"Driver: 250y, 3 Wood: 235y, ..." longest-first for the prompt context
+    lines; unset (0/None) carries are skipped. Filtered before the sort so
+    only real clubs are compared; the stable sort keeps equal-carry clubs in
+    bag order. The display lookup is bound once, not re-resolved per club."""
+    items = [(k, v) for k, v in club_distances.items() if v]
+    items.sort(key=itemgetter(1), reverse=True)
+    display = CLUB_DISPLAY_NAMES.get
+    return ", ".join(f"{display(k, k)}: {v}y" for k, v in items)
+
 # Map GolferProfile keys to our keys
 _PROFILE_KEY_MAP = {
     "driver": "driver",
@@ -124,6 +137,18 @@ def canonical_club(raw: object) -> Optional[str]:
     return _CLUB_ALIASES.get(key)
 
 
+# Every key spelling we ship (canonical keys, GolferProfile keys, aliases)
+# resolved once at import, so the per-shot bag normalization is a dict hit
+# instead of strip/lower/replace on every key. Anything else — free-form
+# spacing/casing from the model or voice — still goes through
+# `canonical_club`, so this table can never disagree with it.
+_CANONICAL_BY_KEY: dict[str, str] = {
+    key: club
+    for key in (*physics.CLUB_REFERENCE, *_PROFILE_KEY_MAP, *_CLUB_ALIASES)
+    if (club := canonical_club(_PROFILE_KEY_MAP.get(key, key))) is not None
+}
+
+
 def normalize_club_distances(raw: dict[str, int]) -> dict[str, int]:
     """Normalize club distance keys from GolferProfile format AND any
     spoken/model shorthand ('7i', '3w', 'sand wedge', ...) to canonical
@@ -137,17 +162,21 @@ def normalize_club_distances(raw: dict[str, int]) -> dict[str, int]:
     `build_strategy_payload`, escaping to a 500 mid-round;
     [[no-fake-data-fallbacks]] — dropped, not fabricated, and always logged).
     """
-    result: dict[str, int] = {}
-    for key, value in raw.items():
-        if not value or value <= 0:
-            continue
-        mapped = _PROFILE_KEY_MAP.get(key, key)
-        normalized = canonical_club(mapped)
-        if normalized is None:
+    return {
+        club: value
+        for key, value in raw.items()
+        if value and value > 0 and (club := _canonical_bag_key(key)) is not None
+    }
+
+
+def _canonical_bag_key(key: str) -> Optional[str]:
+    """Canonical club for one bag key, or None (logged) when unrecognized."""
+    club = _CANONICAL_BY_KEY.get(key)
+    if club is None:
+        club = canonical_club(_PROFILE_KEY_MAP.get(key, key))
+        if club is None:
             log.warning("normalize_club_distances: dropping unrecognized club %r", key)
-            continue
-        result[normalized] = value
-    return result
+    return club
 
 
 def physics_plays_like(
@@ -225,14 +254,19 @@ def compute_adjustments(
     Returns:
         (adjusted_distance, list of adjustments applied)
     """
-    has_weather_effect = weather is not None and (
-        weather.wind_speed_mph >= 3
-        or abs(weather.temperature_f - 70.0) >= 5
-        or weather.altitude_ft > 500
-        or weather.conditions in ("soft", "firm")
-    )
-    if abs(elevation_change_ft) <= 1 and not has_weather_effect:
-        return raw_distance, []  # nothing to adjust — skip the solves
+    # Nothing to adjust — skip the solves. Flat ground is the common case
+    # (every hole without elevation data), so test it first and only then
+    # look at the weather.
+    if -1 <= elevation_change_ft <= 1 and (
+        weather is None
+        or (
+            weather.wind_speed_mph < 3
+            and -5 < weather.temperature_f - 70.0 < 5
+            and weather.altitude_ft <= 500
+            and weather.conditions not in ("soft", "firm")
+        )
+    ):
+        return raw_distance, []
 
     bag = {
         c: int(d)
@@ -245,7 +279,7 @@ def compute_adjustments(
     # 1. Elevation — same club-aware Δh/tan(descent) number course_intel's
     # effective_yards speaks (physics.elevation_only_plays_like), so the
     # "treat it as X" context line and this breakdown never disagree.
-    if abs(elevation_change_ft) > 1:
+    if not -1 <= elevation_change_ft <= 1:
         elev_adj = physics.elevation_only_plays_like(raw_distance, elevation_change_ft) - raw_distance
         if elev_adj != 0:
             direction = "uphill" if elevation_change_ft > 0 else "downhill"
@@ -327,6 +361,17 @@ def compute_adjustments(
     return max(1, round(plays_like)), adjustments
 
 
+@lru_cache(maxsize=256)
+def _clubs_by_distance(items: tuple[tuple[str, int], ...]) -> tuple[tuple[str, int], ...]:
+    """`(club, distance)` pairs longest-first. Keyed on the bag's items in
+    insertion order so equal-distance ties break exactly as an uncached
+    stable sort would."""
+    return tuple(sorted(items, key=lambda x: x[1], reverse=True))
+
+
+_DEFAULT_CLUBS_BY_DISTANCE = _clubs_by_distance(tuple(DEFAULT_CLUB_DISTANCES.items()))
+
+
 def select_club(
     target_yards: int,
     club_distances: dict[str, int],
@@ -342,10 +387,14 @@ def select_club(
     Returns:
         (club_name, club_distance)
     """
-    distances = club_distances or DEFAULT_CLUB_DISTANCES
-
-    # Sort clubs by distance descending
-    clubs = sorted(distances.items(), key=lambda x: x[1], reverse=True)
+    # Clubs by distance descending — the default bag's order is built once at
+    # import, a player's bag is memoized (the same bag is re-sorted on every
+    # shot of a round otherwise).
+    clubs = (
+        _clubs_by_distance(tuple(club_distances.items()))
+        if club_distances
+        else _DEFAULT_CLUBS_BY_DISTANCE
+    )
     if not clubs:
         return ("7iron", 160)
 
@@ -8,7 +8,9 @@ This module (the live per-hole caddie intelligence builder) is never
 imported by `course_intel_writer.py`.
 """
 
+import asyncio
 import logging
+import time
 from typing import Optional
 from app.caddie.green_geometry import approach_bearing_deg as compute_approach_bearing_deg
 from app.caddie.physics import elevation_only_plays_like
@@ -24,6 +26,7 @@ from app.services.elevation import (
     compute_green_slope,
     compute_hole_elevation_profile,
 )
+from app.services.keyed_locks import keyed_lock
 from app.services.weather import (
     fetch_weather,
     compute_air_density_factor,
@@ -34,6 +37,20 @@ from app.services import courses_mapped
 log = logging.getLogger("looper.course_intel")
 
 
+async def _none() -> None:
+    return None
+
+
+def _none_on_error(result, what: str, hole_number) -> Optional[object]:
+    """One `asyncio.gather(..., return_exceptions=True)` leg: the value, or
+    None (logged) when that leg raised. Cancellation is never swallowed."""
+    if isinstance(result, BaseException):
+        if not isinstance(result, Exception):
+            raise result
+        log.warning("%s lookup failed for hole %s", what, hole_number, exc_info=result)
+        return None
+    return result
+
 
 async def build_hole_intelligence(
     hole_coords: dict,
@@ -144,15 +161,25 @@ async def build_hole_intelligence(
                 description=gs["description"],
             )
     else:
-        # LIVE COMPUTE — unchanged behavior, plus write-back.
-        tee_elev = green_elev = None
-        if tee and green:
-            tee_elev = await fetch_elevation_cached(tee["lat"], tee["lng"])
-            green_elev = await fetch_elevation_cached(green["lat"], green["lng"])
-            if tee_elev is not None and green_elev is not None:
-                elevation_change = green_elev - tee_elev  # positive = uphill
-
-        slope_result = await compute_green_slope(green) if green else None
+        # LIVE COMPUTE, plus write-back. The tee/green point lookups and the
+        # green-slope grid are independent round-trips, so they run
+        # concurrently. A leg that raises degrades to None (logged) — the
+        # same honest "absent" a failed USGS lookup already returns — rather
+        # than sinking the rest of the hole's intel.
+        tee_elev, green_elev, slope_result = await asyncio.gather(
+            fetch_elevation_cached(tee["lat"], tee["lng"]) if tee and green else _none(),
+            fetch_elevation_cached(green["lat"], green["lng"]) if tee and green else _none(),
+            compute_green_slope(green) if green else _none(),
+            return_exceptions=True,
+        )
+        tee_elev, green_elev, slope_result = (
+            _none_on_error(tee_elev, "tee elevation", hole_number),
+            _none_on_error(green_elev, "green elevation", hole_number),
+            _none_on_error(slope_result, "green slope", hole_number),
+        )
+        if tee_elev is not None and green_elev is not None:
+            elevation_change = green_elev - tee_elev  # positive = uphill
+
         if slope_result:
             green_slope_data = GreenSlope(
                 direction=slope_result["direction"],
@@ -237,15 +264,66 @@ async def build_hole_intelligence(
     )
 
 
+# In-process weather cache. /weather and /course-intel both rebuild the
+# conditions for the same course coordinates several times a round, and each
+# build costs an Open-Meteo round-trip plus an elevation lookup. Keyed on
+# (lat, lng) rounded to 1e-4 deg (~10m) so every golfer on the property shares
+# the entry; weather moves on minute scales, so 5 minutes of staleness is well
+# inside the forecast's own resolution. Altitude already has a durable
+# Postgres cache behind fetch_elevation_cached, so it needs no second layer.
+# Single-worker uvicorn makes a bare module dict safe (see strategy._CACHE).
+# The degraded WeatherConditions() fallback is NEVER cached — an Open-Meteo
+# blip must not pin calm/70F for the whole window.
+
+_WEATHER_CACHE: dict[tuple[int, int], tuple[float, WeatherConditions]] = {}
+_WEATHER_CACHE_TTL_S = 5 * 60
+_WEATHER_CACHE_MAX = 256
+# Held only while a fetch for the cell is in flight (see services/keyed_locks).
+_WEATHER_LOCKS: dict[tuple[int, int], asyncio.Lock] = {}
+# Clock seam: tests patch this, not the process-wide time.monotonic.
+_now = time.monotonic
+
+
+def _weather_cache_key(lat: float, lng: float) -> tuple[int, int]:
+    return (round(lat * 10000), round(lng * 10000))
+
+
 async def build_weather_conditions(
     lat: float,
     lng: float,
 ) -> WeatherConditions:
-    """Fetch and build weather conditions for a course location."""
+    """Fetch and build weather conditions for a course location.
+
+    Served from `_WEATHER_CACHE` when a fresh entry exists; concurrent misses
+    for the same key wait on one fetch instead of each hitting Open-Meteo."""
+    key = _weather_cache_key(lat, lng)
+    entry = _WEATHER_CACHE.get(key)
+    if entry is not None and _now() - entry[0] <= _WEATHER_CACHE_TTL_S:
+        return entry[1].model_copy()
+
+    async with keyed_lock(_WEATHER_LOCKS, key):
+        entry = _WEATHER_CACHE.get(key)
+        if entry is not None and _now() - entry[0] <= _WEATHER_CACHE_TTL_S:
+            return entry[1].model_copy()
+        weather = await _build_weather_conditions_uncached(lat, lng)
+        if weather is None:
+            return WeatherConditions()
+        if key not in _WEATHER_CACHE and len(_WEATHER_CACHE) >= _WEATHER_CACHE_MAX:
+            oldest = min(_WEATHER_CACHE, key=lambda k: _WEATHER_CACHE[k][0])
+            _WEATHER_CACHE.pop(oldest, None)
+        _WEATHER_CACHE[key] = (_now(), weather)
+        return weather.model_copy()
+
+
+async def _build_weather_conditions_uncached(
+    lat: float,
+    lng: float,
+) -> Optional[WeatherConditions]:
+    """None when Open-Meteo fails — the caller substitutes the defaults."""
     try:
         weather_data = await fetch_weather(lat, lng)
     except Exception:
-        return WeatherConditions()
+        return None
 
     # Get course elevation
     altitude = await fetch_elevation_cached(lat, lng)
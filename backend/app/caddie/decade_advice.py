@@ -213,6 +213,8 @@ _SEVERITY_ORDER: dict[str, int] = {
     "mild": 1,
 }
 
+_SEVERE_OR_DEATH: frozenset[str] = frozenset({"severe", "death"})
+
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
@@ -603,7 +605,7 @@ def cross_hazard_line(
     candidates = [
         h for h in zone
         if h.line_side.lower() == "center"
-        and h.penalty_severity in ("severe", "death")
+        and h.penalty_severity in _SEVERE_OR_DEATH
         and (expected_advance_yds - 15.0) <= h.carry_yards <= (expected_advance_yds + 25.0)
     ]
     if not candidates:
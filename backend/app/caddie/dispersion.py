@@ -3,6 +3,7 @@
 Based on TrackMan/DECADE research data on amateur shot patterns.
 """
 
+from bisect import bisect_left
 from typing import Optional
 
 
@@ -105,32 +106,55 @@ _CLUB_CATEGORY = {
 }
 
 
+# Every category table shares these handicap breakpoints.
+_HCP_KEYS: tuple[int, ...] = (0, 5, 10, 15, 20, 25, 30)
+
+
 def _interpolate_handicap(
     table: dict[int, tuple[float, float, float]],
     handicap: float,
 ) -> tuple[float, float, float]:
     """Interpolate dispersion values between handicap breakpoints."""
     hcp = max(0, min(30, handicap))
-    keys = sorted(table.keys())
-
-    if hcp <= keys[0]:
-        return table[keys[0]]
-    if hcp >= keys[-1]:
-        return table[keys[-1]]
-
-    for i in range(len(keys) - 1):
-        k1, k2 = keys[i], keys[i + 1]
-        if k1 <= hcp <= k2:
-            t = (hcp - k1) / (k2 - k1)
-            v1 = table[k1]
-            v2 = table[k2]
-            return (
-                v1[0] + t * (v2[0] - v1[0]),
-                v1[1] + t * (v2[1] - v1[1]),
-                v1[2] + t * (v2[2] - v1[2]),
-            )
-
-    return table[keys[-1]]
+    if hcp <= _HCP_KEYS[0]:
+        return table[_HCP_KEYS[0]]
+    if hcp >= _HCP_KEYS[-1]:
+        return table[_HCP_KEYS[-1]]
+
+    i = bisect_left(_HCP_KEYS, hcp)
+    k1, k2 = _HCP_KEYS[i - 1], _HCP_KEYS[i]
+    if hcp == k2:
+        return table[k2]
+    t = (hcp - k1) / (k2 - k1)
+    v1 = table[k1]
+    v2 = table[k2]
+    return (
+        v1[0] + t * (v2[0] - v1[0]),
+        v1[1] + t * (v2[1] - v1[1]),
+        v1[2] + t * (v2[2] - v1[2]),
+    )
+
+
+# Per-integer-handicap lookup, built once at import: every club name resolves
+# straight to its category's 31-row table (handicap 0..30), so a call is one
+# dict lookup plus an index — no per-call key sort or breakpoint scan. The
+# breakpoints sit on integers, so linear interpolation between two adjacent
+# integer rows is the same line `_interpolate_handicap` walks; fractional
+# handicaps stay exact.
+_HCP_LUT_MAX = 30
+
+
+def _build_lut(table: dict[int, tuple[float, float, float]]) -> tuple[tuple[float, float, float], ...]:
+    return tuple(_interpolate_handicap(table, h) for h in range(_HCP_LUT_MAX + 1))
+
+
+_LUT_BY_CATEGORY: dict[str, tuple[tuple[float, float, float], ...]] = {
+    category: _build_lut(table) for category, table in _DISPERSION_BY_CLUB_AND_HANDICAP.items()
+}
+_DEFAULT_LUT = _LUT_BY_CATEGORY["mid_iron"]
+_LUT_BY_CLUB: dict[str, tuple[tuple[float, float, float], ...]] = {
+    club: _LUT_BY_CATEGORY[category] for club, category in _CLUB_CATEGORY.items()
+}
 
 
 def get_dispersion(
@@ -148,10 +172,18 @@ def get_dispersion(
     if handicap is None:
         handicap = 15.0
 
-    category = _CLUB_CATEGORY.get(club, "mid_iron")
-    table = _DISPERSION_BY_CLUB_AND_HANDICAP.get(category, _DISPERSION_BY_CLUB_AND_HANDICAP["mid_iron"])
-
-    width, depth, short_bias = _interpolate_handicap(table, handicap)
+    lut = _LUT_BY_CLUB.get(club, _DEFAULT_LUT)
+
+    hcp = max(0.0, min(float(_HCP_LUT_MAX), handicap))
+    i = int(hcp)
+    t = hcp - i
+    if t == 0.0:
+        width, depth, short_bias = lut[i]
+    else:
+        (w1, d1, s1), (w2, d2, s2) = lut[i], lut[i + 1]
+        width = w1 + t * (w2 - w1)
+        depth = d1 + t * (d2 - d1)
+        short_bias = s1 + t * (s2 - s1)
 
     return {
         "width_yards": round(width, 1),
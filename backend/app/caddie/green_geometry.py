@@ -116,7 +116,7 @@ def approach_bearing_deg(
     return math.degrees(math.atan2(x_east, y_north)) % 360.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GreenRead:
     """Deterministic "which side leaves the uphill putt" read, in the
     player's own left/right frame relative to their approach direction."""
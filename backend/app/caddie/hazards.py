@@ -238,6 +238,24 @@ def _xy_m(base_lat: float, base_lon: float, lat: float, lon: float) -> tuple[flo
     return x, y
 
 
+def _xy_m_many(
+    base_lat: float, base_lon: float, points_lonlat: list[tuple[float, float]]
+) -> list[tuple[float, float]]:
+    """``_xy_m`` over a list of ``(lon, lat)`` points — the same per-point
+    formula, in one tight loop with the math helpers bound once. Tree/woods
+    and water observation passes project hundreds of ring vertices per hole;
+    this keeps that a single call instead of one Python call per vertex."""
+    radians, cos = math.radians, math.cos
+    m_per_deg = _LAT_M_PER_DEG
+    return [
+        (
+            (lon - base_lon) * m_per_deg * cos(radians((base_lat + lat) / 2.0)),
+            (lat - base_lat) * m_per_deg,
+        )
+        for lon, lat in points_lonlat
+    ]
+
+
 def _round_to_5(value: float) -> int:
     return int(round(value / 5.0)) * 5
 
@@ -452,6 +470,57 @@ def _hole_polyline(feature_list: list[dict]) -> Optional[list[tuple[float, float
     return None
 
 
+# One non-degenerate polyline segment, precomputed once per hole:
+# (ax, ay, dx, dy, seg_len_sq, seg_len, ux, uy, cum_m, extend_back, extend_forward).
+_Segment = tuple[float, float, float, float, float, float, float, float, float, bool, bool]
+
+
+def _polyline_segments(path_xy: list[tuple[float, float]]) -> list[_Segment]:
+    """Per-segment geometry for `_project_onto_segments` — lengths, unit
+    directions and cumulative along-path offsets depend only on the path, so
+    a hole's tree/water observation passes (often hundreds of points) compute
+    them once instead of once per point. Zero-length segments are skipped
+    (they never win a projection) but still count toward first/last-segment
+    position, matching `_project_onto_polyline`'s clamping."""
+    segments: list[_Segment] = []
+    cum_m = 0.0
+    last_seg = len(path_xy) - 2
+    for i in range(len(path_xy) - 1):
+        ax, ay = path_xy[i]
+        bx, by = path_xy[i + 1]
+        dx, dy = bx - ax, by - ay
+        seg_len = math.hypot(dx, dy)
+        if seg_len == 0.0:
+            continue
+        segments.append((
+            ax, ay, dx, dy, seg_len * seg_len, seg_len,
+            dx / seg_len, dy / seg_len, cum_m, i == 0, i == last_seg,
+        ))
+        cum_m += seg_len
+    return segments
+
+
+def _project_onto_segments(
+    segments: list[_Segment], hx: float, hy: float
+) -> Optional[tuple[float, float]]:
+    """`_project_onto_polyline` against precomputed `_polyline_segments`."""
+    best: Optional[tuple[float, float, float]] = None  # (dist², carry, lateral)
+    for ax, ay, dx, dy, len_sq, seg_len, ux, uy, cum_m, first, last in segments:
+        t = ((hx - ax) * dx + (hy - ay) * dy) / len_sq
+        if not first:
+            t = max(0.0, t)
+        if not last:
+            t = min(1.0, t)
+        px, py = ax + t * dx, ay + t * dy
+        dist_sq = (hx - px) ** 2 + (hy - py) ** 2
+        if best is None or dist_sq < best[0]:
+            lateral = ux * (hy - ay) - uy * (hx - ax)  # positive = LEFT of this segment
+            best = (dist_sq, cum_m + t * seg_len, lateral)
+    if best is None:
+        return None
+    return best[1], best[2]
+
+
 def _project_onto_polyline(
     path_xy: list[tuple[float, float]], hx: float, hy: float
 ) -> Optional[tuple[float, float]]:
@@ -472,32 +541,11 @@ def _project_onto_polyline(
     caller's max(0, ...) clamp still floors behind-the-tee carries at 0).
 
     Returns ``None`` when the polyline has no non-degenerate segment.
+
+    Projecting many points against one path? Build `_polyline_segments` once
+    and call `_project_onto_segments` per point.
     """
-    best: Optional[tuple[float, float, float]] = None  # (dist², carry, lateral)
-    cum_m = 0.0
-    last_seg = len(path_xy) - 2
-    for i in range(len(path_xy) - 1):
-        ax, ay = path_xy[i]
-        bx, by = path_xy[i + 1]
-        dx, dy = bx - ax, by - ay
-        seg_len = math.hypot(dx, dy)
-        if seg_len == 0.0:
-            continue
-        t = ((hx - ax) * dx + (hy - ay) * dy) / (seg_len * seg_len)
-        if i > 0:
-            t = max(0.0, t)
-        if i < last_seg:
-            t = min(1.0, t)
-        px, py = ax + t * dx, ay + t * dy
-        dist_sq = (hx - px) ** 2 + (hy - py) ** 2
-        ux, uy = dx / seg_len, dy / seg_len
-        lateral = ux * (hy - ay) - uy * (hx - ax)  # positive = LEFT of this segment
-        if best is None or dist_sq < best[0]:
-            best = (dist_sq, cum_m + t * seg_len, lateral)
-        cum_m += seg_len
-    if best is None:
-        return None
-    return best[1], best[2]
+    return _project_onto_segments(_polyline_segments(path_xy), hx, hy)
 
 
 def extract_hole_bend(
@@ -563,7 +611,7 @@ def extract_hole_bend(
         # equivalent here, unlike extract_hole_hazards).
         return None
 
-    path_xy = [_xy_m(tee_lat, tee_lon, lat, lon) for lon, lat in path]
+    path_xy = _xy_m_many(tee_lat, tee_lon, path)
     tee_projected = _project_onto_polyline(path_xy, 0.0, 0.0)  # tee = frame origin
     if tee_projected is None:
         return None  # degenerate polyline (all zero-length segments)
@@ -728,13 +776,13 @@ def extract_hole_hazards(
         path = [(float(c[0]), float(c[1])) for c in polyline]
     if path is None:
         path = _hole_polyline(feature_list)
-    path_xy: Optional[list[tuple[float, float]]] = None
+    path_segments: Optional[list[_Segment]] = None
     tee_along_m = 0.0
     if path is not None:
-        path_xy = [_xy_m(tee_lat, tee_lon, lat, lon) for lon, lat in path]
-        tee_projected = _project_onto_polyline(path_xy, 0.0, 0.0)  # tee = frame origin
+        path_segments = _polyline_segments(_xy_m_many(tee_lat, tee_lon, path))
+        tee_projected = _project_onto_segments(path_segments, 0.0, 0.0)  # tee = frame origin
         if tee_projected is None:
-            path_xy = None  # degenerate polyline (all zero-length segments)
+            path_segments = None  # degenerate polyline (all zero-length segments)
         else:
             tee_along_m = tee_projected[0]
 
@@ -744,7 +792,7 @@ def extract_hole_hazards(
     # tee-anchored local frame; carry_m is UNCLAMPED (behind-tee is negative)
     # so callers choose their own clamp/drop policy.
     def _classify(hx: float, hy: float) -> tuple[float, float]:
-        projected = _project_onto_polyline(path_xy, hx, hy) if path_xy else None
+        projected = _project_onto_segments(path_segments, hx, hy) if path_segments else None
         if projected is not None:
             return projected[0] - tee_along_m, projected[1]
         return ux * hx + uy * hy, ux * hy - uy * hx  # positive lateral = LEFT
@@ -919,8 +967,8 @@ def _extract_tree_line_hazards(
     """
     observations: list[tuple[float, float, float, float, float, float]] = []
     # (carry_m, lateral_yards, hx, hy, lat, lon)
-    for lon, lat in _tree_observations(feature_list):
-        hx, hy = _xy_m(tee_lat, tee_lon, lat, lon)
+    points = _tree_observations(feature_list)
+    for (lon, lat), (hx, hy) in zip(points, _xy_m_many(tee_lat, tee_lon, points)):
         carry_m, lateral_m = classify(hx, hy)
         if carry_m < 0:
             continue  # behind the tee — dropped, not clamped (module docstring)
@@ -1253,9 +1301,9 @@ def _classify_danger_observations(
     ``_TREE_MAX_LATERAL_YARDS`` off the line are dropped (keeps only the edge
     FACING the played line)."""
     out: list[tuple[float, float]] = []
-    for lon, lat in obs_lonlat:
-        hx, hy = _xy_m(tee_lat, tee_lon, lat, lon)
-        projected = _project_onto_polyline(path_xy, hx, hy)
+    segments = _polyline_segments(path_xy)
+    for hx, hy in _xy_m_many(tee_lat, tee_lon, obs_lonlat):
+        projected = _project_onto_segments(segments, hx, hy)
         if projected is None:
             continue
         carry_m, lateral_m = projected[0] - tee_along_m, projected[1]
@@ -1355,7 +1403,7 @@ def extract_corridor_profile(
         # fabricated chord-frame corridor (unlike extract_hole_hazards).
         return None
 
-    path_xy = [_xy_m(tee_lat, tee_lon, lat, lon) for lon, lat in path]
+    path_xy = _xy_m_many(tee_lat, tee_lon, path)
     tee_projected = _project_onto_polyline(path_xy, 0.0, 0.0)
     if tee_projected is None:
         return None  # degenerate polyline (all zero-length segments)
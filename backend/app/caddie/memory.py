@@ -10,12 +10,12 @@ takeaways from the round's conversation + shot history, and writes them to
 
 import os
 from typing import Optional
-import anthropic
 from sqlalchemy import select
 
 from app.db.engine import async_session
 from app.db.models import CaddieMemory, GolferProfile, PlayerProfile
 from app.caddie.session import RoundSession
+from app.services.anthropic_client import anthropic_client
 
 
 _MEMORY_KINDS = {"tendency", "preference", "course_history", "incident"}
@@ -137,10 +137,10 @@ SHOTS:
 {shots_text}
 """
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = anthropic_client(api_key)
     model = os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-5-20250929")
     try:
-        message = client.messages.create(
+        message = await client.messages.create(
             model=model,
             max_tokens=600,
             temperature=0.3,
@@ -187,11 +187,14 @@ def _parse_memories_json(raw: str) -> list[dict]:
     fence = re.search(r"```(?:json)?\s*(.+?)\s*```", text, re.DOTALL)
     if fence:
         text = fence.group(1)
-    obj_match = re.search(r"\{.*\}", text, re.DOTALL)
-    if not obj_match:
+    # First "{" to last "}" — the span a greedy r"\{.*\}" would match,
+    # without the regex's backtracking when no "}" follows.
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end < start:
         return []
     try:
-        obj = json.loads(obj_match.group(0))
+        obj = json.loads(text[start:end + 1])
     except json.JSONDecodeError:
         return []
     memories = obj.get("memories")
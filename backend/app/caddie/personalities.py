@@ -157,6 +157,23 @@ Example responses:
 
 DEFAULT_PERSONALITY_ID = "classic"
 
+# Seed-fallback list payload, built once: the seeds are immutable module
+# state, so there is nothing per-request about it.
+_SEED_LIST_PAYLOAD: tuple[dict, ...] = tuple(
+    {
+        "id": p.id,
+        "name": p.name,
+        "description": p.description,
+        "avatar": p.avatar,
+        "voice_id": p.voice_id,
+        "response_style": p.response_style,
+        "traits": p.traits,
+        "is_builtin": True,
+        "author_user_id": None,
+    }
+    for p in PERSONALITIES.values()
+)
+
 
 def _row_to_personality(row: CaddiePersonaRow) -> CaddiePersonality:
     return CaddiePersonality(
@@ -246,20 +263,7 @@ async def list_personalities(user_id: Optional[str] = None) -> list[dict]:
         ]
 
     # Empty DB → seed fallback (dev path before migration 003 is applied)
-    return [
-        {
-            "id": p.id,
-            "name": p.name,
-            "description": p.description,
-            "avatar": p.avatar,
-            "voice_id": p.voice_id,
-            "response_style": p.response_style,
-            "traits": p.traits,
-            "is_builtin": True,
-            "author_user_id": None,
-        }
-        for p in PERSONALITIES.values()
-    ]
+    return list(_SEED_LIST_PAYLOAD)
 
 
 async def create_personality(
@@ -146,7 +146,7 @@ def air_density_kg_m3(
 # ── Flight integration (RK4) ──────────────────────────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LaunchConditions:
     """Initial ball state: speed (m/s), launch angle (deg), backspin (rpm)."""
 
@@ -155,7 +155,7 @@ class LaunchConditions:
     spin_rpm: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlightSample:
     """The landing-plane crossing of one integrated trajectory."""
 
@@ -273,7 +273,7 @@ def _sample_from_state(
 # ── Club reference table (ground truth for the aero calibration) ──────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClubReference:
     """Tour-average launch prior + the reference flight it must integrate to.
 
@@ -488,7 +488,7 @@ def roll_out(
 # ── Conditions + the two questions the caddie asks ────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShotConditions:
     """Resolved physical conditions for ONE shot (see conditions_from_weather)."""
 
@@ -503,7 +503,7 @@ class ShotConditions:
 NEUTRAL_CONDITIONS = ShotConditions()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShotResult:
     """What one club actually does under the given conditions."""
 
@@ -10,6 +10,22 @@ from app.caddie.types import (
 )
 
 
+# Everything this module builds is computed here from already-parsed numbers,
+# so the result models are assembled with `model_construct` (no re-validation).
+# The one caller-supplied value, `handicap`, is coerced the way validation
+# would; tests/test_player_stats.py pins that the output round-trips through
+# full validation unchanged.
+
+
+# (miss_short_pct, miss_long_pct) keyed on "handicap above 10": higher
+# handicaps come up short more often.
+_MISS_PROFILE: dict[bool, tuple[float, float]] = {True: (58.0, 42.0), False: (52.0, 48.0)}
+
+
+def _as_float(value: Optional[float]) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
 def analyze_player_stats(
     rounds: list[dict],
     handicap: Optional[float] = None,
@@ -28,11 +44,18 @@ def analyze_player_stats(
     if not rounds:
         return _default_stats(handicap)
 
-    all_scores: list[dict] = []  # {holeNumber, strokes, par}
+    # One pass over every scored hole: bucket strokes-vs-par (eagle-or-better
+    # and triple-or-worse clamp into the end buckets) and accumulate per-par
+    # totals, instead of re-walking a list of per-hole dicts once per stat.
+    to_par_counts: dict[int, int] = {-2: 0, -1: 0, 0: 0, 1: 0, 2: 0, 3: 0}
+    par_strokes: dict[int, int] = {3: 0, 4: 0, 5: 0}
+    par_holes: dict[int, int] = {3: 0, 4: 0, 5: 0}
+    par5_bogey = 0
+    total_holes = 0
     rounds_analyzed = 0
 
     for rnd in rounds:
-        holes_by_num = {h["number"]: h for h in rnd.get("holes", [])}
+        pars_by_num = {h["number"]: h.get("par", 4) for h in rnd.get("holes", ())}
         scores = rnd.get("scores", [])
         # We analyze the first player's scores (owner) or all scores
         # In practice, the frontend should send only the user's rounds
@@ -46,44 +69,44 @@ def analyze_player_stats(
             strokes = s.get("strokes")
             if strokes is None or hole_num is None:
                 continue
-            hole = holes_by_num.get(hole_num, {})
-            par = hole.get("par", 4)
-            all_scores.append({
-                "holeNumber": hole_num,
-                "strokes": strokes,
-                "par": par,
-                "courseId": rnd.get("courseId"),
-            })
-
-    if not all_scores:
+            par = pars_by_num.get(hole_num, 4)
+            total_holes += 1
+            to_par = strokes - par
+            if to_par <= -2:
+                to_par_counts[-2] += 1
+            elif to_par >= 3:
+                to_par_counts[3] += 1
+            elif to_par in to_par_counts:
+                to_par_counts[to_par] += 1
+            if par in par_holes:
+                par_strokes[par] += strokes
+                par_holes[par] += 1
+                if par == 5 and strokes >= 6:
+                    par5_bogey += 1
+
+    if not total_holes:
         return _default_stats(handicap)
 
     # Scoring distribution
-    total_holes = len(all_scores)
-    eagles = sum(1 for s in all_scores if s["strokes"] <= s["par"] - 2) / total_holes * 100
-    birdies = sum(1 for s in all_scores if s["strokes"] == s["par"] - 1) / total_holes * 100
-    pars = sum(1 for s in all_scores if s["strokes"] == s["par"]) / total_holes * 100
-    bogeys = sum(1 for s in all_scores if s["strokes"] == s["par"] + 1) / total_holes * 100
-    doubles = sum(1 for s in all_scores if s["strokes"] == s["par"] + 2) / total_holes * 100
-    triples = sum(1 for s in all_scores if s["strokes"] >= s["par"] + 3) / total_holes * 100
+    eagles = to_par_counts[-2] / total_holes * 100
+    birdies = to_par_counts[-1] / total_holes * 100
+    pars = to_par_counts[0] / total_holes * 100
+    bogeys = to_par_counts[1] / total_holes * 100
+    doubles = to_par_counts[2] / total_holes * 100
+    triples = to_par_counts[3] / total_holes * 100
 
     # Par averages
-    par3_scores = [s["strokes"] for s in all_scores if s["par"] == 3]
-    par4_scores = [s["strokes"] for s in all_scores if s["par"] == 4]
-    par5_scores = [s["strokes"] for s in all_scores if s["par"] == 5]
-
-    par_avg = ParAverages(
-        par3=sum(par3_scores) / len(par3_scores) if par3_scores else 3.5,
-        par4=sum(par4_scores) / len(par4_scores) if par4_scores else 4.8,
-        par5=sum(par5_scores) / len(par5_scores) if par5_scores else 5.5,
+    par_avg = ParAverages.model_construct(
+        par3=par_strokes[3] / par_holes[3] if par_holes[3] else 3.5,
+        par4=par_strokes[4] / par_holes[4] if par_holes[4] else 4.8,
+        par5=par_strokes[5] / par_holes[5] if par_holes[5] else 5.5,
     )
 
     # Tendencies
-    doubles_total = sum(1 for s in all_scores if s["strokes"] >= s["par"] + 2)
+    doubles_total = to_par_counts[2] + to_par_counts[3]
     doubles_per_round = doubles_total / max(rounds_analyzed, 1)
 
-    par5_bogey = sum(1 for s in all_scores if s["par"] == 5 and s["strokes"] >= 6)
-    par5_total = len(par5_scores)
+    par5_total = par_holes[5]
     par5_bogey_rate = (par5_bogey / par5_total * 100) if par5_total > 0 else 20.0
 
     # Miss direction heuristic: handicap-based assumption
@@ -96,20 +119,22 @@ def analyze_player_stats(
         elif handicap > 10:
             miss_direction = "right"  # Still predominantly
 
-    tendencies = PlayerTendencies(
+    hcp = handicap or 15
+    miss_short, miss_long = _MISS_PROFILE[hcp > 10]
+    tendencies = PlayerTendencies.model_construct(
         miss_direction=miss_direction,
-        miss_short_pct=58.0 if (handicap or 15) > 10 else 52.0,
-        miss_long_pct=42.0 if (handicap or 15) > 10 else 48.0,
-        three_putts_per_round=max(0.5, min(5.0, (handicap or 15) * 0.15)),
+        miss_short_pct=miss_short,
+        miss_long_pct=miss_long,
+        three_putts_per_round=max(0.5, min(5.0, hcp * 0.15)),
         doubles_per_round=round(doubles_per_round, 1),
         par5_bogey_rate=round(par5_bogey_rate, 1),
         scoring_zone_bogey_rate=25.0,  # Need shot tracking for real data
     )
 
-    return PlayerStatistics(
-        handicap=handicap,
+    return PlayerStatistics.model_construct(
+        handicap=_as_float(handicap),
         rounds_analyzed=rounds_analyzed,
-        scoring_distribution=ScoringDistribution(
+        scoring_distribution=ScoringDistribution.model_construct(
             eagles=round(eagles, 1),
             birdies=round(birdies, 1),
             pars=round(pars, 1),
@@ -134,8 +159,8 @@ def get_hole_history(
     for rnd in rounds:
         if rnd.get("courseId") != course_id:
             continue
-        holes_by_num = {h["number"]: h for h in rnd.get("holes", [])}
-        hole = holes_by_num.get(hole_number, {})
+        # Only the one hole is needed — no per-round number->hole dict.
+        hole = next((h for h in rnd.get("holes", []) if h.get("number") == hole_number), {})
         par_on_hole = hole.get("par", 4)
 
         for s in rnd.get("scores", []):
@@ -146,8 +171,12 @@ def get_hole_history(
         return None
 
     avg = sum(scores_on_hole) / len(scores_on_hole)
-    birdies = sum(1 for s in scores_on_hole if s < par_on_hole)
-    bogeys = sum(1 for s in scores_on_hole if s > par_on_hole)
+    birdies = bogeys = 0
+    for s in scores_on_hole:
+        if s < par_on_hole:
+            birdies += 1
+        elif s > par_on_hole:
+            bogeys += 1
 
     return HolePlayerHistory(
         times_played=len(scores_on_hole),
@@ -165,35 +194,37 @@ def _default_stats(handicap: Optional[float]) -> PlayerStatistics:
 
     # Estimate scoring distribution from handicap
     if hcp <= 5:
-        dist = ScoringDistribution(
+        dist = ScoringDistribution.model_construct(
             eagles=1.0, birdies=15.0, pars=50.0, bogeys=25.0, doubles=7.0, triples_plus=2.0
         )
-        par_avg = ParAverages(par3=3.1, par4=4.2, par5=4.9)
+        par_avg = ParAverages.model_construct(par3=3.1, par4=4.2, par5=4.9)
     elif hcp <= 15:
-        dist = ScoringDistribution(
+        dist = ScoringDistribution.model_construct(
             eagles=0.5, birdies=8.0, pars=35.0, bogeys=35.0, doubles=15.0, triples_plus=6.5
         )
-        par_avg = ParAverages(par3=3.5, par4=4.8, par5=5.3)
+        par_avg = ParAverages.model_construct(par3=3.5, par4=4.8, par5=5.3)
     elif hcp <= 25:
-        dist = ScoringDistribution(
+        dist = ScoringDistribution.model_construct(
             eagles=0.2, birdies=3.0, pars=20.0, bogeys=35.0, doubles=25.0, triples_plus=16.8
         )
-        par_avg = ParAverages(par3=4.0, par4=5.3, par5=6.0)
+        par_avg = ParAverages.model_construct(par3=4.0, par4=5.3, par5=6.0)
     else:
-        dist = ScoringDistribution(
+        dist = ScoringDistribution.model_construct(
             eagles=0.0, birdies=1.0, pars=10.0, bogeys=25.0, doubles=30.0, triples_plus=34.0
         )
-        par_avg = ParAverages(par3=4.5, par4=5.8, par5=6.8)
+        par_avg = ParAverages.model_construct(par3=4.5, par4=5.8, par5=6.8)
 
-    return PlayerStatistics(
-        handicap=handicap,
+    high = hcp > 10
+    miss_short, miss_long = _MISS_PROFILE[high]
+    return PlayerStatistics.model_construct(
+        handicap=_as_float(handicap),
         rounds_analyzed=0,
         scoring_distribution=dist,
         par_averages=par_avg,
-        tendencies=PlayerTendencies(
-            miss_direction="right" if hcp > 10 else "balanced",
-            miss_short_pct=58.0 if hcp > 10 else 52.0,
-            miss_long_pct=42.0 if hcp > 10 else 48.0,
+        tendencies=PlayerTendencies.model_construct(
+            miss_direction="right" if high else "balanced",
+            miss_short_pct=miss_short,
+            miss_long_pct=miss_long,
             three_putts_per_round=max(0.5, hcp * 0.15),
             doubles_per_round=max(0.5, hcp * 0.15),
         ),
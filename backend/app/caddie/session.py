@@ -7,10 +7,11 @@ stay simple: load → mutate → `await sessions.update(session)`.
 
 import json
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 from pydantic import BaseModel
-from sqlalchemy import select, delete, text, update as sql_update
+from sqlalchemy import func, select, delete, text, update as sql_update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.caddie.club_selection import normalize_club_distances
@@ -35,7 +36,12 @@ class ShotRecord(BaseModel):
     timestamp: float = 0.0
 
 
-class VoiceCaddieMessage(BaseModel):
+# A plain slotted dataclass, not a model: every instance is rebuilt from our
+# own `caddie_messages` rows on each session load (a long round rehydrates
+# hundreds), so there is no external input to validate. ShotRecord stays a
+# model — it is built from LLM tool arguments and JSONB we must coerce.
+@dataclass(slots=True)
+class VoiceCaddieMessage:
     role: str  # "user" | "assistant" | "tool"
     content: str
 
@@ -413,9 +419,10 @@ class SessionManager:
 
     async def active_count(self) -> int:
         async with async_session() as db:
-            stmt = select(CaddieSessionRow).where(CaddieSessionRow.status == "active")
-            result = await db.execute(stmt)
-            return len(result.scalars().all())
+            stmt = select(func.count()).select_from(CaddieSessionRow).where(
+                CaddieSessionRow.status == "active",
+            )
+            return (await db.execute(stmt)).scalar_one()
 
     def needs_weather_refresh(self, session: RoundSession) -> bool:
         if session.weather is None:
@@ -3,6 +3,8 @@
 Adapted for amateur golfers with handicap multipliers.
 """
 
+from bisect import bisect_left
+from functools import lru_cache
 from typing import Optional
 
 
@@ -47,6 +49,14 @@ _GREEN_TABLE = [
     (4, 1.20), (3, 1.13), (2, 1.06), (1, 1.02),
 ]
 
+_TABLES_BY_LIE: dict[str, list[tuple[int, float]]] = {
+    "tee": _TEE_TABLE,
+    "fairway": _FAIRWAY_TABLE,
+    "rough": _ROUGH_TABLE,
+    "sand": _SAND_TABLE,
+    "green": _GREEN_TABLE,
+}
+
 # Handicap multipliers for expected strokes
 # Higher handicap = more strokes expected from same position
 _HANDICAP_MULTIPLIERS = {
@@ -61,6 +71,10 @@ _HANDICAP_MULTIPLIERS = {
 }
 
 
+def _neg_distance(row: tuple[int, float]) -> float:
+    return -row[0]
+
+
 def _interpolate(table: list[tuple[int, float]], distance: float) -> float:
     """Interpolate expected strokes from a lookup table."""
     if not table:
@@ -70,14 +84,38 @@ def _interpolate(table: list[tuple[int, float]], distance: float) -> float:
     if distance <= table[-1][0]:
         return table[-1][1]
 
-    for i in range(len(table) - 1):
-        d1, s1 = table[i]
-        d2, s2 = table[i + 1]
-        if d2 <= distance <= d1:
-            t = (distance - d2) / (d1 - d2) if d1 != d2 else 0
-            return s2 + t * (s1 - s2)
+    # Tables run longest-first, so bisect on negated distance: `i` is the
+    # first row at or inside `distance`, and row i-1 the one just beyond it.
+    i = bisect_left(table, -distance, key=_neg_distance)
+    d1, s1 = table[i - 1]
+    d2, s2 = table[i]
+    t = (distance - d2) / (d1 - d2) if d1 != d2 else 0
+    return s2 + t * (s1 - s2)
 
-    return table[-1][1]
+
+_HCP_MULT_KEYS: tuple[int, ...] = tuple(sorted(_HANDICAP_MULTIPLIERS))
+
+
+def _interpolate_handicap_multiplier(hcp: float) -> float:
+    if hcp <= _HCP_MULT_KEYS[0]:
+        return _HANDICAP_MULTIPLIERS[_HCP_MULT_KEYS[0]]
+    if hcp >= _HCP_MULT_KEYS[-1]:
+        return _HANDICAP_MULTIPLIERS[_HCP_MULT_KEYS[-1]]
+
+    i = bisect_left(_HCP_MULT_KEYS, hcp)
+    k1, k2 = _HCP_MULT_KEYS[i - 1], _HCP_MULT_KEYS[i]
+    t = (hcp - k1) / (k2 - k1)
+    return _HANDICAP_MULTIPLIERS[k1] + t * (
+        _HANDICAP_MULTIPLIERS[k2] - _HANDICAP_MULTIPLIERS[k1]
+    )
+
+
+# Handicap indexes are published to one decimal, so nearly every lookup lands
+# on this 0.0..36.0 grid. Built with the same interpolation, so a grid hit is
+# bit-identical to interpolating; anything finer falls through to it.
+_HCP_MULT_LUT: tuple[float, ...] = tuple(
+    _interpolate_handicap_multiplier(i / 10) for i in range(361)
+)
 
 
 def _handicap_multiplier(handicap: Optional[float]) -> float:
@@ -86,22 +124,10 @@ def _handicap_multiplier(handicap: Optional[float]) -> float:
         handicap = 15.0
 
     hcp = max(0, min(36, handicap))
-    keys = sorted(_HANDICAP_MULTIPLIERS.keys())
-
-    if hcp <= keys[0]:
-        return _HANDICAP_MULTIPLIERS[keys[0]]
-    if hcp >= keys[-1]:
-        return _HANDICAP_MULTIPLIERS[keys[-1]]
-
-    for i in range(len(keys) - 1):
-        k1, k2 = keys[i], keys[i + 1]
-        if k1 <= hcp <= k2:
-            t = (hcp - k1) / (k2 - k1)
-            return _HANDICAP_MULTIPLIERS[k1] + t * (
-                _HANDICAP_MULTIPLIERS[k2] - _HANDICAP_MULTIPLIERS[k1]
-            )
-
-    return 1.2
+    tenths = round(hcp * 10)
+    if tenths / 10 == hcp:
+        return _HCP_MULT_LUT[tenths]
+    return _interpolate_handicap_multiplier(hcp)
 
 
 # Distance bucket edges used by personal_sg keys (matches caddie/learning.py).
@@ -177,15 +203,15 @@ def expected_strokes(
     if personal is not None:
         return personal
 
-    tables = {
-        "tee": _TEE_TABLE,
-        "fairway": _FAIRWAY_TABLE,
-        "rough": _ROUGH_TABLE,
-        "sand": _SAND_TABLE,
-        "green": _GREEN_TABLE,
-    }
+    return _baseline_expected_strokes(distance_yards, lie, handicap)
+
 
-    table = tables.get(lie, _FAIRWAY_TABLE)
+# Keyed on the exact arguments — no distance/handicap coarsening, so a hit is
+# the same float the tables would produce. Club selection re-asks the same
+# (leave, handicap) pairs every turn of a round (leaves are rounded yards).
+@lru_cache(maxsize=4096)
+def _baseline_expected_strokes(distance_yards: float, lie: str, handicap: Optional[float]) -> float:
+    table = _TABLES_BY_LIE.get(lie, _FAIRWAY_TABLE)
     base = _interpolate(table, distance_yards)
     return base * _handicap_multiplier(handicap)
 
@@ -17,7 +17,8 @@ Every stop is STRUCTURAL — never warning text (prose does not stop a loop):
 
 Prompt-cache guard (plan D7): ``tools=TEXT_TOOLS`` is passed on EVERY call —
 a constant, name-sorted list that never mutates mid-round, so after the
-one-time bust it lives inside the cached prefix.
+one-time bust it lives inside the cached prefix. Conversation history gets
+its own breakpoint (``_with_history_breakpoint``).
 """
 
 import asyncio
@@ -72,6 +73,26 @@ def _accepts_temperature(model: str) -> bool:
     return model.startswith(_TEMPERATURE_OK_PREFIXES)
 
 
+def _with_history_breakpoint(messages: list[dict]) -> list[dict]:
+    """Copy of `messages` with a prompt-cache breakpoint on the last HISTORY
+    message (the one before the new transcript) — the 2nd of the API's 4, the
+    stable system block holding the 1st. tools + system + history is then a
+    cached prefix: every later call of a tool-loop turn reads it back, as does
+    the next turn whenever the CURRENT SITUATION block hasn't moved. The new
+    transcript is never marked — it is the one part guaranteed to change."""
+    convo = list(messages)
+    if len(convo) >= 2 and isinstance(convo[-2].get("content"), str):
+        convo[-2] = {
+            **convo[-2],
+            "content": [{
+                "type": "text",
+                "text": convo[-2]["content"],
+                "cache_control": {"type": "ephemeral"},
+            }],
+        }
+    return convo
+
+
 def _clip(payload: str) -> str:
     if len(payload) <= _TOOL_RESULT_MAX_CHARS:
         return payload
@@ -103,7 +124,7 @@ async def run_caddie_turn(
     seen_calls: dict[tuple[str, str], dict] = {}  # (name, canonical-json-args) -> result
     parts: list[str] = []
     output_tokens = 0
-    convo = list(messages)  # never mutate the caller's list
+    convo = _with_history_breakpoint(messages)  # never mutates the caller's list
 
     for call_n in range(_MAX_MODEL_CALLS):
         force_text = (call_n == _MAX_MODEL_CALLS - 1) or (output_tokens >= _OUTPUT_TOKEN_BUDGET)
@@ -11,7 +11,7 @@ from typing import Optional
 
 from app.caddie.types import CaddiePersonality, TeeShotNumbers
 from app.caddie.session import RoundSession
-from app.caddie.club_selection import CLUB_DISPLAY_NAMES
+from app.caddie.club_selection import CLUB_DISPLAY_NAMES, format_club_distances
 from app.caddie.green_geometry import GREEN_GROUNDING_RULE
 from app.caddie.hazards import BEND_GROUNDING_RULE, HAZARD_GROUNDING_RULE
 from app.caddie.language import desired_language
@@ -426,11 +426,7 @@ def _situation_block(session: Optional[RoundSession]) -> str:
     if session.handicap is not None:
         lines.append(f"Handicap: {session.handicap}")
     if session.club_distances:
-        clubs = ", ".join(
-            f"{CLUB_DISPLAY_NAMES.get(k, k)}: {v}y"
-            for k, v in sorted(session.club_distances.items(), key=lambda x: x[1], reverse=True)
-            if v
-        )
+        clubs = format_club_distances(session.club_distances)
         if clubs:
             lines.append(f"Player clubs: {clubs}")
     if session.weather:
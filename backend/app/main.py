@@ -154,6 +154,14 @@ async def startup():
     asyncio.create_task(cleanup_loop())
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Close the pooled outbound httpx clients (services/http_clients.py)."""
+    from app.services.http_clients import close_pooled_clients
+
+    await close_pooled_clients()
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint."""
@@ -3,6 +3,7 @@
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 import anthropic
+import asyncio
 import json
 import logging
 import os
@@ -58,7 +59,7 @@ from app.caddie.personalities import (
     personality_visible,
     DEFAULT_PERSONALITY_ID,
 )
-from app.caddie.club_selection import CLUB_DISPLAY_NAMES, normalize_club_distances
+from app.caddie.club_selection import format_club_distances, normalize_club_distances
 from app.caddie.session import RoundSession, sessions, get_owned_session
 from app.db.engine import async_session
 from app.db.models import PlayerProfile
@@ -66,6 +67,7 @@ from app.caddie import memory as memory_mod
 from app.caddie import learning as learning_mod
 from app.caddie.types import PlayerStatistics, PlayerTendencies
 from app.services import courses_mapped
+from app.services.anthropic_client import anthropic_client
 from app.services.course_guides import _precompute_course_guides
 from app.services.course_elevation import (
     _green_persisted_elevation,
@@ -183,6 +185,30 @@ def _advice_model() -> str:
     )
 
 
+def _chat_model() -> str:
+    """Model for OTHER-intent turns (chit-chat, repeats, "thanks") that still
+    reach the Claude loop — the "easily answerable, weaker model" half of the
+    two-tier owner directive (specs/caddie-two-tier-routing-plan.md). A
+    dedicated env, NOT chained to ANTHROPIC_MODEL: a prod override of the
+    shared var must not silently move small talk onto a bigger model."""
+    return os.getenv("CADDIE_CHAT_MODEL") or "claude-haiku-4-5"
+
+
+def _model_for_intent(intent: Intent) -> str:
+    """The one routing rule for the text mouths: only OTHER drops to
+    `_chat_model()` — ADVICE and FACT (and anything the router can't place
+    confidently, which it sends to ADVICE by design) keep the advice model."""
+    if intent is Intent.OTHER:
+        return _chat_model()
+    return _advice_model()
+
+
+def _turn_model(transcript: str) -> str:
+    """Per-turn model for the stateless mouths, which don't classify the turn
+    themselves: `classify_intent` is pure regex, so this costs nothing."""
+    return _model_for_intent(classify_intent(transcript))
+
+
 def _safe_course_uuid(value) -> str | None:
     """The caddie_sessions.course_id column is a UUID — legacy rounds carry
     slug ids that must never reach the INSERT (asyncpg DataError)."""
@@ -364,6 +390,11 @@ async def start_session(
         # this is a cheap all-skip pass with ZERO LLM calls.
         bg.add_task(_precompute_course_guides, course_id)
 
+    # sessions.update() rewrites the WHOLE row (shot_history included), so a
+    # resume that changes none of the fields this route owns skips it — one
+    # less write, and one less chance to clobber a concurrent append_shot.
+    owned_before = (session.club_distances, session.handicap, session.player_stats)
+
     bag_source = "none"
     if request.club_distances:
         # Normalize at the bag assignment (owner P0 2026-07-18) — the
@@ -411,7 +442,8 @@ async def start_session(
             personal_sg=dict(profile.personal_sg or {}),
         )
 
-    await sessions.update(session)
+    if (session.club_distances, session.handicap, session.player_stats) != owned_before:
+        await sessions.update(session)
 
     return {
         "round_id": session.round_id,
@@ -459,7 +491,7 @@ async def end_session(round_id: str, user_id: str = Depends(current_user_id)):
         "status": "ended",
         "round_id": round_id,
         "shots_recorded": len(session.shot_history),
-        "holes_played": len(set(s.hole_number for s in session.shot_history)),
+        "holes_played": len({s.hole_number for s in session.shot_history}),
         "messages_exchanged": len(session.conversation_history),
         "memories_saved": len(saved),
         "learning": learning_summary,
@@ -849,6 +881,80 @@ def _format_yardage_line(
     return f"{hole_label}{par_label} — yardage unknown. Ask the player or say so; never guess.{par_sanity_suffix}"
 
 
+# Conversation window. A plain [-20:] slide moves the start of `messages` by
+# one exchange every turn past 20 messages, so the history prefix the tool
+# loop caches (`tool_loop._with_history_breakpoint`) would be rewritten every
+# turn and never read back. The start instead advances in 10-message steps:
+# 20-29 messages sent, start fixed for five exchanges at a time. Starts stay
+# even, so the window still opens on a user turn.
+_HISTORY_WINDOW = 20
+_HISTORY_WINDOW_STEP = 10
+
+
+def _history_messages(history: list) -> list[dict]:
+    overflow = len(history) - _HISTORY_WINDOW
+    start = overflow - overflow % _HISTORY_WINDOW_STEP if overflow > 0 else 0
+    return [{"role": msg.role, "content": msg.content} for msg in history[start:]]
+
+
+# The stateless orb's history is whatever the client sends, so bound it in
+# size as well as count: at most 10 messages, newest first, until ~1500 tokens
+# (len // 4 heuristic) are spent. Older assistant replies are clipped — the
+# tail of a long answer two shots ago rarely matters to this one — and the
+# newest message, always kept, is itself clipped to the budget so one huge
+# message can't carry the window past it.
+_CLIENT_HISTORY_MAX_MESSAGES = 10
+_CLIENT_HISTORY_CHAR_BUDGET = 6000
+_CLIENT_HISTORY_ASSISTANT_CHARS = 500
+
+
+def _client_history_messages(history: list[dict]) -> list[dict]:
+    kept: list[dict] = []
+    budget = _CLIENT_HISTORY_CHAR_BUDGET
+    for msg in reversed(history[-_CLIENT_HISTORY_MAX_MESSAGES:]):
+        role = msg.get("role", "user")
+        content = msg.get("content") or ""
+        if isinstance(content, str):
+            if role == "assistant" and len(content) > _CLIENT_HISTORY_ASSISTANT_CHARS:
+                content = content[:_CLIENT_HISTORY_ASSISTANT_CHARS].rstrip() + "…"
+            if len(content) > budget and not kept:
+                content = content[: budget - 1].rstrip() + "…"
+            size = len(content)
+        else:
+            # Content blocks pass through as sent — clipping structured
+            # content isn't safe — and are charged by their repr's length.
+            size = len(str(content))
+        if size > budget and kept:
+            break
+        budget -= size
+        kept.append({"role": role, "content": content})
+    kept.reverse()
+    # Open on a user turn, as the untrimmed window would.
+    while kept and kept[0]["role"] == "assistant":
+        kept.pop(0)
+    return kept
+
+
+# Static "--- INSTRUCTIONS ---" prose of both text mouths' stable block,
+# formatted once at import (CADDIE_HOUSE_REGISTER is itself a constant) and
+# interpolated whole per turn. The session mouth adds the round-memory lines;
+# the stateless orb has no round to remember.
+_VOICE_INSTRUCTIONS_STATELESS = f"""--- INSTRUCTIONS ---
+You are caddying for this golfer right now, on the course. Respond to their question or comment.
+Your reply is SPOKEN ALOUD on the course.
+{CADDIE_HOUSE_REGISTER}
+If they ask about club selection, aim, or strategy, use the CURRENT SITUATION section to give
+specific, actionable advice — and when the hole context shows an uphill/downhill change or a
+plays-like distance, factor it in and SAY it briefly ("plays more like 195 with the climb").
+Any "Local knowledge" line is written for golfers in general — filter it through THIS player's
+real distances before repeating it: a hazard beyond their reach off the tee is irrelevant
+(don't mention it); talk about what's in play at THEIR landing zone. A 300-yard driver doesn't
+care about a bunker at 370. If they're just chatting, be personable but keep it golf-focused."""
+_VOICE_INSTRUCTIONS_SESSION = _VOICE_INSTRUCTIONS_STATELESS + """
+You have memory of the entire round conversation and prior rounds. Reference earlier holes/shots
+or known tendencies when relevant."""
+
+
 async def _build_session_voice_prompt(
     request: SessionVoiceRequest, user_id: str,
 ) -> tuple[list[dict], list[dict], str]:
@@ -864,8 +970,8 @@ async def _build_session_voice_prompt(
     prefix (persona + memory + instructions + hazard rule) carrying a prompt-
     cache breakpoint, followed by the VOLATILE per-hole CURRENT SITUATION
     block with no breakpoint (specs/caddie-prompt-caching-text-path-plan.md).
-    Conversation history renders after both, in `messages` — not cached by
-    this item, by design (see plan §1).
+    Conversation history renders after both, in `messages`; the tool loop
+    adds the second breakpoint on its last message.
     """
     session = await get_owned_session(request.round_id, user_id)
 
@@ -943,11 +1049,7 @@ async def _build_session_voice_prompt(
         context_parts.append(f"Player handicap: {session.handicap}")
 
     if session.club_distances:
-        clubs_str = ", ".join(
-            f"{CLUB_DISPLAY_NAMES.get(k, k)}: {v}y"
-            for k, v in sorted(session.club_distances.items(), key=lambda x: x[1], reverse=True)
-            if v
-        )
+        clubs_str = format_club_distances(session.club_distances)
         if clubs_str:
             context_parts.append(f"Player's clubs: {clubs_str}")
 
@@ -980,9 +1082,7 @@ async def _build_session_voice_prompt(
     context = "\n".join(context_parts)
 
     # Use full round conversation history (not just last 10)
-    messages = []
-    for msg in session.conversation_history[-20:]:
-        messages.append({"role": msg.role, "content": msg.content})
+    messages = _history_messages(session.conversation_history)
     messages.append({"role": "user", "content": request.transcript})
 
     # BLOCK 0 — STABLE (persona + memory + instructions + hazard rule):
@@ -990,19 +1090,7 @@ async def _build_session_voice_prompt(
     memory_section = f"\n--- PLAYER MEMORY ---\n{memories_block}\n" if memories_block else ""
     stable_text = f"""{personality.system_prompt}
 {memory_section}
---- INSTRUCTIONS ---
-You are caddying for this golfer right now, on the course. Respond to their question or comment.
-Your reply is SPOKEN ALOUD on the course.
-{CADDIE_HOUSE_REGISTER}
-If they ask about club selection, aim, or strategy, use the CURRENT SITUATION section to give
-specific, actionable advice — and when the hole context shows an uphill/downhill change or a
-plays-like distance, factor it in and SAY it briefly ("plays more like 195 with the climb").
-Any "Local knowledge" line is written for golfers in general — filter it through THIS player's
-real distances before repeating it: a hazard beyond their reach off the tee is irrelevant
-(don't mention it); talk about what's in play at THEIR landing zone. A 300-yard driver doesn't
-care about a bunker at 370. If they're just chatting, be personable but keep it golf-focused.
-You have memory of the entire round conversation and prior rounds. Reference earlier holes/shots
-or known tendencies when relevant.
+{_VOICE_INSTRUCTIONS_SESSION}
 
 {output_language_rule()}
 {HAZARD_GROUNDING_RULE}
@@ -1050,7 +1138,7 @@ async def session_voice(request: SessionVoiceRequest, user_id: str = Depends(cad
     strategy_turn`, the SAME implementation `/session/strategy` uses); a
     SCORE-class ask gets the honest text-path handoff line. Both persist the
     user/assistant pair to the message ledger exactly like a normal turn.
-    FACT/OTHER stays on the Claude tool loop, unchanged.
+    FACT/OTHER stays on the Claude tool loop — OTHER on `_chat_model()`.
     """
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
@@ -1111,10 +1199,10 @@ async def session_voice(request: SessionVoiceRequest, user_id: str = Depends(cad
     )
 
     try:
-        client = anthropic.AsyncAnthropic(
-            api_key=api_key, timeout=_CADDIE_TIMEOUT_S, max_retries=_CADDIE_MAX_RETRIES,
+        client = anthropic_client(
+            api_key, timeout=_CADDIE_TIMEOUT_S, max_retries=_CADDIE_MAX_RETRIES,
         )
-        model = _advice_model()
+        model = _model_for_intent(intent)
         response_text = ""
         async for kind, payload in run_caddie_turn(
             client, model, system_blocks, messages, ctx,
@@ -1164,6 +1252,7 @@ async def _sse_reply(
     hole_number: Optional[int] = None,
     persona_id: Optional[str] = None,
     ctx: Optional[caddie_tools.ToolContext] = None,
+    model: Optional[str] = None,
 ) -> AsyncIterator[str]:
     """Stream a Claude reply as SSE frames — the async twin of the tool-loop
     consumption in session_voice/voice_caddie, with IDENTICAL params (model,
@@ -1176,7 +1265,8 @@ async def _sse_reply(
     built by `_build_session_voice_prompt` / `_build_voice_prompt` — the SDK
     forwards both forms unchanged. `ctx` is the tool-resolution context; None
     (or a session-less ctx) means every tool answers honestly that no live
-    round data is available (the stateless mouth).
+    round data is available (the stateless mouth). `model` is the caller's
+    per-turn pick (`_turn_model`); None means the advice model.
 
     Framing (internal contract, not a shared model — see
     specs/voice-streaming-replies-plan.md §1):
@@ -1193,10 +1283,10 @@ async def _sse_reply(
     partial reply into the round's conversation ledger. Tool blocks are never
     persisted — `caddie_messages` stays a plain role/content ledger.
     """
-    client = anthropic.AsyncAnthropic(
-        api_key=api_key, timeout=_CADDIE_TIMEOUT_S, max_retries=_CADDIE_MAX_RETRIES,
+    client = anthropic_client(
+        api_key, timeout=_CADDIE_TIMEOUT_S, max_retries=_CADDIE_MAX_RETRIES,
     )
-    model = _advice_model()
+    model = model or _advice_model()
     tool_ctx = ctx or caddie_tools.ToolContext(
         session=None, round_id=None, user_id="", default_hole=hole_number,
     )
@@ -1340,6 +1430,7 @@ async def session_voice_stream(request: SessionVoiceRequest, user_id: str = Depe
             hole_number=session.current_hole,
             persona_id=persona_id,
             ctx=ctx,
+            model=_model_for_intent(intent),
         ),
         media_type="text/event-stream",
     )
@@ -1517,49 +1608,31 @@ async def get_weather(
         raise HTTPException(500, f"Weather fetch failed: {e}")
 
 
-@router.post("/course-intel")
-async def get_course_intel(
-    request: CourseIntelRequest,
-    round_id: Optional[str] = None,
-    user_id: str = Depends(caddie_rate_limited_user),
-):
-    """Build course intelligence. Caches in session only if caller owns the round.
-
-    Auth required — fans out to USGS/Open-Meteo/OSM and Claude downstream."""
-    if not request.hole_coordinates:
-        raise HTTPException(400, "No hole coordinates provided")
-
-    lat = request.course_lat
-    lng = request.course_lng
-    if lat is None or lng is None:
-        first = request.hole_coordinates[0]
-        green = first.get("green", {})
-        lat = green.get("lat", 0)
-        lng = green.get("lng", 0)
+# Holes are independent (own elevation/slope lookups, own write-back), so
+# /course-intel builds them concurrently. Bounded: a cold hole already fans
+# out to ~11 cached-elevation lookups, each taking a pooled DB connection
+# (engine pool is 5+5), so an unbounded 18-hole gather would just queue on
+# the pool.
+_COURSE_INTEL_HOLE_CONCURRENCY = 4
 
-    weather = await build_weather_conditions(lat, lng)
 
-    # Resolve the owned session once (used both for the stored-course hazard
-    # lookup below and the cache write at the end).
-    owned_session = None
+async def _owned_session(round_id: Optional[str], user_id: Optional[str]):
+    """The round's session when the caller owns it, else None."""
     if round_id and user_id:
         candidate = await sessions.get(round_id)
         if candidate and candidate.user_id == user_id:
-            owned_session = candidate
+            return candidate
+    return None
 
-    # Curated per-hole bunker/water geometry from our own PostGIS store, keyed
-    # by hole number, when this round is mapped to a stored course. REPLACES
-    # (never merges with) the fuzzy Overpass-derived hazards below — curated
-    # data must not be polluted by Overpass strays (owner escalation 2026-07-06).
-    stored_holes_by_number: dict[int, dict] = {}
-    if owned_session is not None and owned_session.course_id:
-        stored_course = await courses_mapped.get_course(owned_session.course_id)
-        if stored_course:
-            stored_holes_by_number = {h["number"]: h for h in stored_course.get("holes", [])}
 
-    holes: list[dict] = []
-    hole_intel_map: dict[int, HoleIntelligence] = {}
-    for hc in request.hole_coordinates:
+async def _course_intel_hole(
+    hc: dict,
+    stored_holes_by_number: dict[int, dict],
+    course_id: Optional[str],
+    limit: asyncio.Semaphore,
+) -> tuple[dict, Optional[HoleIntelligence]]:
+    """One hole of /course-intel: (response entry, intel or None on failure)."""
+    async with limit:
         try:
             stored_hole = stored_holes_by_number.get(hc.get("holeNumber"))
             persisted_elev = _green_persisted_elevation(stored_hole)
@@ -1571,7 +1644,7 @@ async def get_course_intel(
                 yards=hc.get("yards"),
                 handicap_rating=hc.get("handicap"),
                 persisted_elevation=persisted_elev,
-                course_id=owned_session.course_id if owned_session else None,
+                course_id=course_id,
                 persisted_guide=persisted_guide,
             )
             stored_hole = stored_holes_by_number.get(intel.hole_number)
@@ -1612,13 +1685,66 @@ async def get_course_intel(
             if intel.strategy_guide is not None:
                 intel.strategy_guide = validate_guide(intel.strategy_guide, intel.hazards)
 
-            holes.append(intel.model_dump())
-            hole_intel_map[intel.hole_number] = intel
+            return intel.model_dump(), intel
         except Exception as e:
             # Visible, never silent: a per-hole failure hides ALL intel for
             # that hole (the all-zero-elevation incident, 2026-07-07).
             log.exception("course-intel failed for hole %s", hc.get("holeNumber"))
-            holes.append({"hole_number": hc.get("holeNumber", 0), "error": str(e)})
+            return {"hole_number": hc.get("holeNumber", 0), "error": str(e)}, None
+
+
+@router.post("/course-intel")
+async def get_course_intel(
+    request: CourseIntelRequest,
+    round_id: Optional[str] = None,
+    user_id: str = Depends(caddie_rate_limited_user),
+):
+    """Build course intelligence. Caches in session only if caller owns the round.
+
+    Auth required — fans out to USGS/Open-Meteo/OSM and Claude downstream."""
+    if not request.hole_coordinates:
+        raise HTTPException(400, "No hole coordinates provided")
+
+    lat = request.course_lat
+    lng = request.course_lng
+    if lat is None or lng is None:
+        first = request.hole_coordinates[0]
+        green = first.get("green", {})
+        lat = green.get("lat", 0)
+        lng = green.get("lng", 0)
+
+    # Weather and the owned-session lookup (used both for the stored-course
+    # hazard lookup below and the cache write at the end) are independent.
+    weather, owned_session = await asyncio.gather(
+        build_weather_conditions(lat, lng),
+        _owned_session(round_id, user_id),
+    )
+
+    # Curated per-hole bunker/water geometry from our own PostGIS store, keyed
+    # by hole number, when this round is mapped to a stored course. REPLACES
+    # (never merges with) the fuzzy Overpass-derived hazards below — curated
+    # data must not be polluted by Overpass strays (owner escalation 2026-07-06).
+    stored_holes_by_number: dict[int, dict] = {}
+    if owned_session is not None and owned_session.course_id:
+        stored_course = await courses_mapped.get_course(owned_session.course_id)
+        if stored_course:
+            stored_holes_by_number = {h["number"]: h for h in stored_course.get("holes", [])}
+
+    course_id = owned_session.course_id if owned_session else None
+    limit = asyncio.Semaphore(_COURSE_INTEL_HOLE_CONCURRENCY)
+    results = await asyncio.gather(*(
+        _course_intel_hole(hc, stored_holes_by_number, course_id, limit)
+        for hc in request.hole_coordinates
+    ))
+
+    # gather preserves request order, so `holes` and the map's last-wins on a
+    # repeated hole number match the old sequential loop.
+    holes: list[dict] = []
+    hole_intel_map: dict[int, HoleIntelligence] = {}
+    for entry, intel in results:
+        holes.append(entry)
+        if intel is not None:
+            hole_intel_map[intel.hole_number] = intel
 
     # Cache everything in session — only when caller owns the round.
     if owned_session is not None:
@@ -1769,11 +1895,7 @@ async def _build_voice_prompt(
         or (normalize_club_distances(stored_bag) if stored_bag else {})
     )
     if club_distances_for_prompt:
-        clubs_str = ", ".join(
-            f"{CLUB_DISPLAY_NAMES.get(k, k)}: {v}y"
-            for k, v in sorted(club_distances_for_prompt.items(), key=lambda x: x[1], reverse=True)
-            if v
-        )
+        clubs_str = format_club_distances(club_distances_for_prompt)
         if clubs_str:
             context_parts.append(f"Player's clubs: {clubs_str}")
 
@@ -1789,12 +1911,7 @@ async def _build_voice_prompt(
 
     context = "\n".join(context_parts)
 
-    messages = []
-    for msg in request.conversation_history[-10:]:
-        messages.append({
-            "role": msg.get("role", "user"),
-            "content": msg.get("content", ""),
-        })
+    messages = _client_history_messages(request.conversation_history)
     messages.append({"role": "user", "content": request.transcript})
 
     # BLOCK 0 — STABLE (persona + memory + instructions + hazard rule):
@@ -1802,17 +1919,7 @@ async def _build_voice_prompt(
     memory_section = f"\n--- PLAYER MEMORY ---\n{memories_block}\n" if memories_block else ""
     stable_text = f"""{personality.system_prompt}
 {memory_section}
---- INSTRUCTIONS ---
-You are caddying for this golfer right now, on the course. Respond to their question or comment.
-Your reply is SPOKEN ALOUD on the course.
-{CADDIE_HOUSE_REGISTER}
-If they ask about club selection, aim, or strategy, use the CURRENT SITUATION section to give
-specific, actionable advice — and when the hole context shows an uphill/downhill change or a
-plays-like distance, factor it in and SAY it briefly ("plays more like 195 with the climb").
-Any "Local knowledge" line is written for golfers in general — filter it through THIS player's
-real distances before repeating it: a hazard beyond their reach off the tee is irrelevant
-(don't mention it); talk about what's in play at THEIR landing zone. A 300-yard driver doesn't
-care about a bunker at 370. If they're just chatting, be personable but keep it golf-focused.
+{_VOICE_INSTRUCTIONS_STATELESS}
 
 {output_language_rule()}
 {HAZARD_GROUNDING_RULE}
@@ -1874,10 +1981,10 @@ async def voice_caddie(
     )
 
     try:
-        client = anthropic.AsyncAnthropic(
-            api_key=api_key, timeout=_CADDIE_TIMEOUT_S, max_retries=_CADDIE_MAX_RETRIES,
+        client = anthropic_client(
+            api_key, timeout=_CADDIE_TIMEOUT_S, max_retries=_CADDIE_MAX_RETRIES,
         )
-        model = _advice_model()
+        model = _turn_model(request.transcript)
         response_text = ""
         async for kind, payload in run_caddie_turn(
             client, model, system_blocks, messages, ctx,
@@ -1923,6 +2030,7 @@ async def voice_caddie_stream(
         _sse_reply(
             api_key, system_blocks, messages,
             log_context="voice_caddie_stream", persona_id=persona_id, ctx=ctx,
+            model=_turn_model(request.transcript),
         ),
         media_type="text/event-stream",
     )
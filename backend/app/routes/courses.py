@@ -18,13 +18,14 @@ Follow-up (future): unify scoring_courses with the mapped courses table
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy import select
 
 from app.db.engine import async_session
 from app.db.models import ScoringCourse as ScoringCourseORM
 from app.models import Course, CourseCreate, HoleInfo, TeeOption
 from app.services.clerk_auth import current_user_id
+from app.services.conditional_get import conditional_json
 
 router = APIRouter(prefix="/api/courses", tags=["courses"])
 
@@ -57,8 +58,11 @@ async def get_courses(owner_id: str = Depends(current_user_id)):
 
 
 @router.get("/{course_id}", response_model=Course)
-async def get_course(course_id: str, owner_id: str = Depends(current_user_id)):
-    """Get a single scoring course by id. Returns 404 if not owned by the caller."""
+async def get_course(
+    course_id: str, request: Request, owner_id: str = Depends(current_user_id)
+):
+    """Get a single scoring course by id. Returns 404 if not owned by the
+    caller; 304 when If-None-Match already names the current ETag."""
     async with async_session() as db:
         result = await db.execute(
             select(ScoringCourseORM).where(
@@ -69,7 +73,7 @@ async def get_course(course_id: str, owner_id: str = Depends(current_user_id)):
         row = result.scalar_one_or_none()
     if not row:
         raise HTTPException(status_code=404, detail="Course not found")
-    return _orm_to_pydantic(row)
+    return conditional_json(request, _orm_to_pydantic(row))
 
 
 @router.post("", response_model=Course)
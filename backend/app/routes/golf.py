@@ -12,6 +12,8 @@ Field mapping (v2.3 → frontend):
   Coords: poi/location/sideFW→green/tee/front/back per hole
 """
 
+import asyncio
+import time
 from collections import defaultdict
 
 from fastapi import APIRouter, HTTPException, Query
@@ -19,11 +21,21 @@ from fastapi.responses import JSONResponse
 import httpx
 import os
 
+from app.services.http_clients import pooled_client
+from app.services.keyed_locks import keyed_lock
+
 router = APIRouter(prefix="/api/golf", tags=["golf"])
 
 GOLF_API_BASE = "https://www.golfapi.io/api/v2.3"
 
 
+def _golfapi_client() -> httpx.AsyncClient:
+    # Bound to 0.0.0.0 (IPv4) as before; pooled so repeat course/coordinate
+    # loads reuse the GolfAPI connection instead of a fresh TLS handshake.
+    transport = httpx.AsyncHTTPTransport(local_address="0.0.0.0")
+    return httpx.AsyncClient(timeout=15, transport=transport)
+
+
 def _api_headers() -> dict:
     key = os.getenv("GOLF_API_KEY", "")
     headers = {"Content-Type": "application/json"}
@@ -200,74 +212,120 @@ def _normalize_coordinates(raw: list) -> list:
 # Route handler
 # ---------------------------------------------------------------------------
 
+# In-process response cache, keyed on (action, id, q). Course, club and
+# coordinate data changes on the scale of seasons and GolfAPI calls are
+# metered, yet the same course id is re-fetched by every device that opens
+# it — the Cache-Control headers below are rarely honored by mobile clients.
+# TTLs mirror those headers (search results 1h, everything else 24h).
+# Only the field an action reads is keyed — (action, id, None) for
+# club/course/coordinates, (action, None, q) for search — so a stray param
+# can't fork one course into many entries.
+# Single-worker uvicorn makes a bare module dict safe (see strategy._CACHE);
+# only normalized successes are stored, never an upstream error.
+_PROXY_CACHE: dict[tuple[str, str | None, str | None], tuple[float, dict]] = {}
+_PROXY_CACHE_MAX = 512
+# Held only while a fetch for the key is in flight (see services/keyed_locks).
+_PROXY_LOCKS: dict[tuple[str, str | None, str | None], asyncio.Lock] = {}
+
+
+def _cache_ttl_s(action: str) -> int:
+    return 3600 if action == "search" else 86400
+
+
+def _proxy_cache_get(key: tuple[str, str | None, str | None]) -> dict | None:
+    entry = _PROXY_CACHE.get(key)
+    if entry is not None and time.monotonic() - entry[0] <= _cache_ttl_s(key[0]):
+        return entry[1]
+    return None
+
+
+async def _fetch_normalized(action: str, q: str | None, id: str | None) -> dict:
+    """One GolfAPI GET for `action`, normalized to the frontend's field names."""
+    client = pooled_client("golfapi", _golfapi_client)
+    if action == "search":
+        resp = await client.get(
+            f"{GOLF_API_BASE}/clubs",
+            params={"name": q},
+            headers=_api_headers(),
+        )
+    elif action == "club":
+        resp = await client.get(
+            f"{GOLF_API_BASE}/clubs/{id}",
+            headers=_api_headers(),
+        )
+    elif action == "course":
+        resp = await client.get(
+            f"{GOLF_API_BASE}/courses/{id}",
+            headers=_api_headers(),
+        )
+    else:  # coordinates
+        resp = await client.get(
+            f"{GOLF_API_BASE}/coordinates/{id}",
+            headers=_api_headers(),
+        )
+
+    if not resp.is_success:
+        raise HTTPException(resp.status_code, f"GolfAPI error: {resp.status_code}")
+
+    data = resp.json()
+
+    # Normalize response fields to match frontend types
+    if action == "search":
+        data = {
+            "clubs": [_normalize_club(c) for c in (data.get("clubs") or [])],
+            "apiRequestsLeft": data.get("apiRequestsLeft"),
+        }
+    elif action == "club":
+        data = _normalize_club(data)
+    elif action == "course":
+        # Full normalization: builds holeData from parsMen[], normalizes tees
+        data = _normalize_course(data)
+    elif action == "coordinates":
+        # Decode poi/location/sideFW into per-hole {green, tee, front, back}
+        raw = data.get("coordinates") or data.get("holes") or []
+        if isinstance(raw, list):
+            data = {"holeData": _normalize_coordinates(raw)}
+    return data
+
+
 @router.get("")
 async def golf_proxy(
     action: str = Query(..., description="search, club, course, or coordinates"),
     q: str = Query(None),
     id: str = Query(None),
 ):
-    """Proxy GolfAPI.io requests, keeping API key server-side."""
+    """Proxy GolfAPI.io requests, keeping API key server-side.
+
+    Served from `_PROXY_CACHE` when a fresh entry exists; concurrent misses for
+    the same key wait on one upstream call."""
+    if action == "search":
+        if not q:
+            raise HTTPException(400, "Missing q parameter")
+    elif action in ("club", "course", "coordinates"):
+        if not id:
+            raise HTTPException(400, "Missing id parameter")
+    else:
+        raise HTTPException(400, f"Unknown action: {action}")
+
+    if action == "search":
+        id = None
+    else:
+        q = None
+    key = (action, id, q)
+    headers = {"Cache-Control": f"public, max-age={_cache_ttl_s(action)}"}
+    data = _proxy_cache_get(key)
+    if data is not None:
+        return JSONResponse(content=data, headers=headers)
+
     try:
-        transport = httpx.AsyncHTTPTransport(local_address="0.0.0.0")
-        async with httpx.AsyncClient(timeout=15, transport=transport) as client:
-            if action == "search":
-                if not q:
-                    raise HTTPException(400, "Missing q parameter")
-                resp = await client.get(
-                    f"{GOLF_API_BASE}/clubs",
-                    params={"name": q},
-                    headers=_api_headers(),
-                )
-            elif action == "club":
-                if not id:
-                    raise HTTPException(400, "Missing id parameter")
-                resp = await client.get(
-                    f"{GOLF_API_BASE}/clubs/{id}",
-                    headers=_api_headers(),
-                )
-            elif action == "course":
-                if not id:
-                    raise HTTPException(400, "Missing id parameter")
-                resp = await client.get(
-                    f"{GOLF_API_BASE}/courses/{id}",
-                    headers=_api_headers(),
-                )
-            elif action == "coordinates":
-                if not id:
-                    raise HTTPException(400, "Missing id parameter")
-                resp = await client.get(
-                    f"{GOLF_API_BASE}/coordinates/{id}",
-                    headers=_api_headers(),
-                )
-            else:
-                raise HTTPException(400, f"Unknown action: {action}")
-
-        if not resp.is_success:
-            raise HTTPException(resp.status_code, f"GolfAPI error: {resp.status_code}")
-
-        data = resp.json()
-
-        # Normalize response fields to match frontend types
-        if action == "search":
-            data = {
-                "clubs": [_normalize_club(c) for c in (data.get("clubs") or [])],
-                "apiRequestsLeft": data.get("apiRequestsLeft"),
-            }
-        elif action == "club":
-            data = _normalize_club(data)
-        elif action == "course":
-            # Full normalization: builds holeData from parsMen[], normalizes tees
-            data = _normalize_course(data)
-        elif action == "coordinates":
-            # Decode poi/location/sideFW into per-hole {green, tee, front, back}
-            raw = data.get("coordinates") or data.get("holes") or []
-            if isinstance(raw, list):
-                data = {"holeData": _normalize_coordinates(raw)}
-
-        cache_time = 3600 if action == "search" else 86400
-        return JSONResponse(
-            content=data,
-            headers={"Cache-Control": f"public, max-age={cache_time}"},
-        )
+        async with keyed_lock(_PROXY_LOCKS, key):
+            data = _proxy_cache_get(key)
+            if data is None:
+                data = await _fetch_normalized(action, q, id)
+                if key not in _PROXY_CACHE and len(_PROXY_CACHE) >= _PROXY_CACHE_MAX:
+                    oldest = min(_PROXY_CACHE, key=lambda k: _PROXY_CACHE[k][0])
+                    _PROXY_CACHE.pop(oldest, None)
+                _PROXY_CACHE[key] = (time.monotonic(), data)
+        return JSONResponse(content=data, headers=headers)
     except httpx.HTTPError as e:
         raise HTTPException(502, f"Golf API request failed: {e}")
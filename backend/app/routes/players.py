@@ -13,13 +13,14 @@ filtering.
 from datetime import datetime, timezone
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy import select
 
 from app.db.engine import async_session
 from app.db.models import Player as PlayerORM
 from app.models import SavedPlayer, PlayerCreate, PlayerUpdate
 from app.services.clerk_auth import current_user_id
+from app.services.conditional_get import conditional_json
 
 router = APIRouter(prefix="/api/players", tags=["players"])
 
@@ -54,8 +55,11 @@ async def get_players(owner_id: str = Depends(current_user_id)):
 
 
 @router.get("/{player_id}", response_model=SavedPlayer)
-async def get_player(player_id: str, owner_id: str = Depends(current_user_id)):
-    """Get a single player by id. Returns 404 if not owned by the caller."""
+async def get_player(
+    player_id: str, request: Request, owner_id: str = Depends(current_user_id)
+):
+    """Get a single player by id. Returns 404 if not owned by the caller;
+    304 when If-None-Match already names the current ETag."""
     async with async_session() as db:
         result = await db.execute(
             select(PlayerORM).where(
@@ -66,7 +70,7 @@ async def get_player(player_id: str, owner_id: str = Depends(current_user_id)):
         row = result.scalar_one_or_none()
     if not row:
         raise HTTPException(status_code=404, detail="Player not found")
-    return _orm_to_pydantic(row)
+    return conditional_json(request, _orm_to_pydantic(row))
 
 
 @router.post("", response_model=SavedPlayer)
@@ -106,9 +110,10 @@ async def update_player(
         if not row:
             raise HTTPException(status_code=404, detail="Player not found")
 
-        # Only update fields that were explicitly provided (exclude_none).
-        # PlayerUpdate field names match the ORM column names directly.
-        for field, value in data.model_dump(exclude_none=True).items():
+        # Only update fields that were explicitly provided: exclude_unset skips
+        # the omitted ones without walking them, exclude_none keeps an explicit
+        # null a no-op. PlayerUpdate field names match the ORM column names.
+        for field, value in data.model_dump(exclude_unset=True, exclude_none=True).items():
             setattr(row, field, value)
         row.updated_at = datetime.now(timezone.utc)
 
@@ -23,7 +23,7 @@ The require_owner gate is applied at the app level (main.py).
 from datetime import datetime, timezone
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy import delete, select, update as sa_update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm.attributes import flag_modified
@@ -50,6 +50,7 @@ from app.models import (
     SettlementFinalize,
 )
 from app.services.clerk_auth import current_user_id
+from app.services.conditional_get import conditional_json
 
 router = APIRouter(prefix="/api/rounds", tags=["rounds"])
 
@@ -211,11 +212,15 @@ async def get_rounds(owner_id: str = Depends(current_user_id)):
 
 
 @router.get("/{round_id}", response_model=Round)
-async def get_round(round_id: str, owner_id: str = Depends(current_user_id)):
-    """Get a single round by id. Returns 404 if not owned by the caller."""
+async def get_round(
+    round_id: str, request: Request, owner_id: str = Depends(current_user_id)
+):
+    """Get a single round by id. Returns 404 if not owned by the caller;
+    304 when If-None-Match already names the current ETag."""
     async with async_session() as db:
         row = await _get_owned_round_row(db, round_id, owner_id)
-        return await _build_full_round(db, row, owner_id)
+        full_round = await _build_full_round(db, row, owner_id)
+    return conditional_json(request, full_round)
 
 
 @router.post("", response_model=Round)
@@ -4,13 +4,13 @@ via Claude vision. Backend only; the camera→review→import UI is a follow-up.
 import base64
 import json
 import os
-import re
 from typing import Optional
 
 import anthropic
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from pydantic import BaseModel
 
+from app.services.anthropic_client import anthropic_client
 from app.services.clerk_auth import current_user_id
 
 router = APIRouter(prefix="/api/scorecard", tags=["scorecard"])
@@ -103,14 +103,17 @@ def _parse_scan_response(text: str) -> ScanScorecardResponse:
                     if the object is missing required keys, if ``players`` / ``holes``
                     are not lists, or if any hole entry is malformed.
     """
-    # Mirror the regex used in voice.py / voice_advanced.py to tolerate fenced blocks
-    # or prose wrappers that a model might accidentally emit.
-    json_match = re.search(r"\{[\s\S]*\}", text)
-    if not json_match:
+    # First "{" to last "}" tolerates fenced blocks or prose wrappers that a
+    # model might accidentally emit. Same span the old greedy r"\{[\s\S]*\}"
+    # search matched, found with two linear scans instead of a regex that
+    # backtracks from every "{" when no "}" follows.
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end < start:
         raise ValueError(f"No JSON object found in model response: {text!r}")
 
     try:
-        raw = json.loads(json_match.group())
+        raw = json.loads(text[start:end + 1])
     except json.JSONDecodeError as exc:
         raise ValueError(f"Malformed JSON in model response: {exc}") from exc
 
@@ -211,11 +214,11 @@ async def scan_scorecard(
 
     # Use the shared ANTHROPIC_MODEL env var (vision-capable; defaults to opus).
     model = os.getenv("ANTHROPIC_MODEL", "claude-opus-4-20250514")
-    client = anthropic.Anthropic(api_key=api_key)
+    client = anthropic_client(api_key)
     image_b64 = base64.standard_b64encode(body).decode()
 
     try:
-        message = client.messages.create(
+        message = await client.messages.create(
             model=model,
             # 2 048 tokens is comfortable for an 18-hole card with 4 players
             # (the compact JSON is ~800 chars / ~200 tokens; headroom for verbose names).
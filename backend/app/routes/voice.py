@@ -7,8 +7,8 @@ import logging
 import os
 import json
 from typing import Optional
-import re
 
+from app.services.anthropic_client import anthropic_client
 from app.services.deepgram import transcribe_audio, grant_live_token
 from app.services.openai_tts import synthesize_speech
 from app.services.clerk_auth import current_user_id
@@ -118,6 +118,41 @@ class VoiceScoreResponse(BaseModel):
     confidence: float = 0.5
 
 
+class _RecordedScores(BaseModel):
+    """The record_scores tool input, type-checked in one validation pass — a
+    non-integer score fails here (500 "try again") instead of slipping into
+    the response. `hole` falls back to the request's hole when omitted."""
+    hole: Optional[int] = None
+    scores: dict[str, int] = {}
+
+
+# Forced via tool_choice in parse_voice_scores so the model's answer arrives as
+# structured tool input instead of JSON embedded in free text.
+_RECORD_SCORES_TOOL: dict = {
+    "name": "record_scores",
+    "description": "Record the parsed score for each player on the hole.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "hole": {"type": "integer"},
+            "scores": {
+                "type": "object",
+                "additionalProperties": {"type": "integer"},
+            },
+        },
+        "required": ["hole", "scores"],
+    },
+}
+
+
+def _score_parse_model() -> str:
+    """Model for score extraction. A forced record_scores call over a short
+    transcript is a small-model task, so it gets its own env (the other
+    ANTHROPIC_MODEL consumers keep theirs) defaulting to Haiku. `or`-chain
+    so an empty env behaves like unset."""
+    return os.getenv("VOICE_SCORE_MODEL") or "claude-haiku-4-5"
+
+
 def _derive_confidence(scores: dict[str, int], player_names: list[str]) -> float:
     """Derive a honest confidence signal from the extraction result.
 
@@ -142,7 +177,7 @@ async def parse_voice_scores(
     if not api_key:
         raise HTTPException(status_code=500, detail="ANTHROPIC_API_KEY not configured")
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = anthropic_client(api_key)
 
     prompt = f"""You are parsing golf scores from a voice transcript.
 
@@ -152,7 +187,7 @@ Par for this hole: {request.par}
 
 Voice transcript: "{request.transcript}"
 
-Parse this and return a JSON object with the scores for each player mentioned.
+Parse this and record the score for each player mentioned with the record_scores tool.
 
 Rules:
 - Match player names flexibly (first name, nickname, partial match)
@@ -161,35 +196,29 @@ Rules:
 - Numbers can be spoken as words (four, five) or digits
 - If a player name sounds similar to one in the list, use that player
 
-Return ONLY valid JSON in this exact format, no other text:
-{{"hole": {request.hole}, "scores": {{"PlayerName": score, "PlayerName2": score}}}}
-
-Use the exact player names from the list above in your response."""
+Use the exact player names from the list above as the keys of "scores"."""
 
     try:
-        model = os.getenv("ANTHROPIC_MODEL", "claude-opus-4-20250514")
-
-        message = client.messages.create(
-            model=model,
+        message = await client.messages.create(
+            model=_score_parse_model(),
             max_tokens=256,
+            tools=[_RECORD_SCORES_TOOL],
+            tool_choice={"type": "tool", "name": _RECORD_SCORES_TOOL["name"]},
             messages=[{"role": "user", "content": prompt}]
         )
 
-        response_text = message.content[0].text
-        print(f"Claude response: {response_text}")
-
-        # Extract JSON from response
-        json_match = re.search(r'\{[\s\S]*\}', response_text)
-        if not json_match:
-            raise HTTPException(status_code=500, detail=f"Could not parse response: {response_text}")
+        # Forced tool call: the SDK has already decoded the arguments, so
+        # there is no prose to regex-scan and no json.loads to fail.
+        tool_use = next((b for b in message.content if b.type == "tool_use"), None)
+        if tool_use is None:
+            raise HTTPException(status_code=500, detail="Could not parse response")
 
-        parsed = json.loads(json_match.group())
-        extracted_scores: dict[str, int] = parsed.get("scores", {})
+        recorded = _RecordedScores.model_validate(tool_use.input)
 
         return VoiceScoreResponse(
-            hole=parsed.get("hole", request.hole),
-            scores=extracted_scores,
-            confidence=_derive_confidence(extracted_scores, request.playerNames),
+            hole=recorded.hole if recorded.hole is not None else request.hole,
+            scores=recorded.scores,
+            confidence=_derive_confidence(recorded.scores, request.playerNames),
         )
     except anthropic.AuthenticationError:
         raise HTTPException(status_code=401, detail="Invalid API key")
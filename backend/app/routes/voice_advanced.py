@@ -8,25 +8,30 @@ import json
 import re
 from typing import Optional
 
+from app.services.anthropic_client import anthropic_client
 from app.services.rate_limit import caddie_rate_limited_user
 
 router = APIRouter(prefix="/api/voice", tags=["voice"])
 
 
-def _get_client() -> anthropic.Anthropic:
+def _get_client() -> anthropic.AsyncAnthropic:
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
         raise HTTPException(500, "ANTHROPIC_API_KEY not configured")
-    return anthropic.Anthropic(api_key=api_key)
+    return anthropic_client(api_key)
 
 
 def _get_model() -> str:
     return os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-5-20250929")
 
 
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```", re.IGNORECASE)
+_JSON_DECODER = json.JSONDecoder()
+
+
 def _safe_json_extract(text: str) -> Optional[str]:
     """Extract JSON from LLM output (handles fenced blocks)."""
-    fenced = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", text, re.IGNORECASE)
+    fenced = _JSON_FENCE_RE.search(text)
     if fenced:
         candidate = fenced.group(1).strip()
         if candidate.startswith("{") or candidate.startswith("["):
@@ -35,30 +40,13 @@ def _safe_json_extract(text: str) -> Optional[str]:
     start = text.find("{")
     if start == -1:
         return None
-
-    depth = 0
-    in_string = False
-    escape = False
-    for i in range(start, len(text)):
-        ch = text[i]
-        if in_string:
-            if escape:
-                escape = False
-            elif ch == "\\":
-                escape = True
-            elif ch == '"':
-                in_string = False
-            continue
-        if ch == '"':
-            in_string = True
-            continue
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-        if depth == 0:
-            return text[start : i + 1]
-    return None
+    # raw_decode tokenizes in C and stops at the end of the first complete
+    # value, so trailing prose (or a second object) is ignored.
+    try:
+        _, end = _JSON_DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
+    return text[start:end]
 
 
 # ── Parse Round Setup ──
@@ -144,6 +132,23 @@ def merge_round_setup(
     )
 
 
+# Local-parser patterns, compiled once (see _local_parse_round_setup).
+_SETUP_STOPWORDS = {"and", "the", "a"}
+_WITH_PLAYERS_RE = re.compile(
+    r"\b(?:with|players?:?)\s+(.+?)"
+    r"(?:\s+(?:at|playing|from|on)\b|[.,]|$)",
+    re.IGNORECASE,
+)
+_AT_COURSE_RE = re.compile(
+    r"\b(?:at|playing)\s+(?!with\b|the\b|from\b)"
+    r"([A-Za-z][A-Za-z'\-]*(?:\s+[A-Za-z][A-Za-z'\-]*){0,3}?)"
+    r"(?:\s+(?:golf|course|today|with)\b|[.,]|$)",
+    re.IGNORECASE,
+)
+_TEE_RE = re.compile(r"(?:from\s+(?:the\s+)?)?(\w+)\s+tees?", re.IGNORECASE)
+_NAME_SPLIT_RE = re.compile(r"[,\s]+")
+
+
 def _local_parse_round_setup(
     transcript: str, expecting: Optional[str] = None
 ) -> RoundSetupResponse:
@@ -157,35 +162,23 @@ def _local_parse_round_setup(
     # Players: capture the phrase after "with"/"players" up to a course/tee cue or
     # end, then tokenize on spaces/commas (so "Dan Matt and John" -> 3 names, not
     # "Dan Matt" merged). Drop connectors.
-    _STOP = {"and", "the", "a"}
     player_names: list[str] = []
-    with_match = re.search(
-        r"\b(?:with|players?:?)\s+(.+?)"
-        r"(?:\s+(?:at|playing|from|on)\b|[.,]|$)",
-        text,
-        re.IGNORECASE,
-    )
+    with_match = _WITH_PLAYERS_RE.search(text)
     if with_match:
-        for n in re.split(r"[,\s]+", with_match.group(1).strip()):
+        for n in _NAME_SPLIT_RE.split(with_match.group(1).strip()):
             n = n.strip()
-            if n and n.lower() not in _STOP:
+            if n and n.lower() not in _SETUP_STOPWORDS:
                 player_names.append(n)
 
     # Course: after "at"/"playing", but NOT "playing with ..." (players) or
     # "playing the blues" (tees) — negative lookahead guards those.
     course_name = ""
-    at_match = re.search(
-        r"\b(?:at|playing)\s+(?!with\b|the\b|from\b)"
-        r"([A-Za-z][A-Za-z'\-]*(?:\s+[A-Za-z][A-Za-z'\-]*){0,3}?)"
-        r"(?:\s+(?:golf|course|today|with)\b|[.,]|$)",
-        text,
-        re.IGNORECASE,
-    )
+    at_match = _AT_COURSE_RE.search(text)
     if at_match:
         course_name = at_match.group(1).strip()
 
     tee_name = None
-    tee_match = re.search(r"(?:from\s+(?:the\s+)?)?(\w+)\s+tees?", text, re.IGNORECASE)
+    tee_match = _TEE_RE.search(text)
     if tee_match:
         tee_name = tee_match.group(1)
 
@@ -194,9 +187,9 @@ def _local_parse_round_setup(
     if expecting == "course" and not course_name and cleaned:
         course_name = cleaned
     elif expecting == "players" and not player_names and cleaned:
-        for n in re.split(r"[,\s]+", cleaned):
+        for n in _NAME_SPLIT_RE.split(cleaned):
             n = n.strip()
-            if n and n.lower() not in _STOP:
+            if n and n.lower() not in _SETUP_STOPWORDS:
                 player_names.append(n)
 
     # De-dup players, preserving order.
@@ -245,7 +238,7 @@ async def parse_round_setup(
         parsed = _local_parse_round_setup(request.transcript, request.expecting)
         return _finalize_round_setup(parsed, request.current)
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = anthropic_client(api_key)
     model = _get_model()
 
     system = """You extract a golf round setup from voice transcription and must return ONLY valid JSON.
@@ -279,7 +272,7 @@ Rules:
             if attempt > 0 and last_err:
                 sys_prompt += f"\n\nYour previous output was invalid. Fix it. Error: {last_err}"
 
-            message = client.messages.create(
+            message = await client.messages.create(
                 model=model,
                 max_tokens=300,
                 temperature=0,
@@ -362,7 +355,7 @@ async def parse_scorecard(
     )
 
     try:
-        message = client.messages.create(
+        message = await client.messages.create(
             model=model,
             max_tokens=1024,
             messages=[
@@ -421,7 +414,7 @@ async def parse_voice_transcript(
     if not api_key:
         raise HTTPException(500, "No API key configured")
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = anthropic_client(api_key)
     model = _get_model()
 
     system = request.systemPrompt or """You are a parser that extracts golf round information from voice transcription.
@@ -447,7 +440,7 @@ Return ONLY valid JSON with the following structure:
         user_msg += "\n" + "\n".join(context_parts)
 
     try:
-        message = client.messages.create(
+        message = await client.messages.create(
             model=model,
             max_tokens=600,
             temperature=0,
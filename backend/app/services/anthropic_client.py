@@ -0,0 +1,36 @@
+"""Shared Anthropic SDK client for every route that calls Claude.
+
+The client is `AsyncAnthropic` so the routes `await` the call: they are all
+`async def`, and a sync `messages.create` there blocked the event loop (every
+other request on the worker, health checks included) for the full LLM latency.
+
+Constructing a client allocates its own httpx client and connection pool, so
+building one per request threw away HTTP keep-alive to api.anthropic.com and
+paid a fresh TCP+TLS handshake on every caddie turn / voice parse / scorecard
+scan. The connection pool is a `pooled_client` (services/http_clients.py), so
+it is per event loop like the other outbound pools and is closed by
+`close_pooled_clients()` at shutdown. The `AsyncAnthropic` wrapped around it is
+cheap and built per call: the API key (rotated through services/secrets.py)
+and the caddie turns' timeout/retry budget are per-client options, while the
+pool is shared by all of them. Routes keep their per-request
+"ANTHROPIC_API_KEY not configured" guard.
+"""
+
+from typing import Any
+
+import anthropic
+import httpx
+
+from app.services.http_clients import pooled_client
+
+
+def _anthropic_http_client() -> httpx.AsyncClient:
+    return pooled_client("anthropic", anthropic.DefaultAsyncHttpxClient)
+
+
+def anthropic_client(api_key: str, **options: Any) -> anthropic.AsyncAnthropic:
+    """A client for `api_key` over the pooled api.anthropic.com connection.
+    `options` (timeout, max_retries) pass through to `AsyncAnthropic`."""
+    return anthropic.AsyncAnthropic(
+        api_key=api_key, http_client=_anthropic_http_client(), **options
+    )
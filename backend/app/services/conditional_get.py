@@ -0,0 +1,40 @@
+"""Conditional GET (ETag / If-None-Match) for owner-scoped read-by-id routes.
+
+The frontend re-fetches a round/player/course it already holds. A content-hash
+ETag over the exact JSON body lets an unchanged resource answer 304 with no
+body. The hash is over the BUILT response, not a row `updated_at`: a round's
+response also embeds player/group/game rows whose edits don't bump the round
+row, so a timestamp ETag could serve a stale 304.
+
+`private, no-cache` — per-user data, never shared-cached, and always
+revalidated (a max-age would show stale scores for its whole window).
+"""
+
+import hashlib
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+_CACHE_CONTROL = "private, no-cache"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """RFC 9110 weak comparison: `*`, or any listed tag equal to ours with a
+    `W/` prefix ignored."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def conditional_json(request: Request, model: BaseModel) -> Response:
+    """`model` as a JSON response carrying an ETag, or a bodiless 304 when the
+    request's If-None-Match already names that ETag."""
+    body = model.model_dump_json().encode()
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -8,15 +8,21 @@ its tests are unchanged.
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
 import math
 import os
 import re
+import time
 import unicodedata
 from urllib.parse import quote
 
 import httpx
 
+from app.services.http_clients import pooled_client
+from app.services.keyed_locks import keyed_lock
+
 log = logging.getLogger(__name__)
 
 MAPBOX_TOKEN = os.getenv("NEXT_PUBLIC_MAPBOX_TOKEN", os.getenv("MAPBOX_TOKEN", ""))
@@ -351,6 +357,51 @@ def mapbox_geocode_url(query: str) -> str:
     return f"https://api.mapbox.com/geocoding/v5/mapbox.places/{quote(query, safe='')}.json"
 
 
+# Geocoder answers for a place name are stable for days, and the same area /
+# course name is typed by many users (search fallback, tee-time area lookup).
+# Only successful responses are cached — a non-2xx or transport failure must
+# be retried on the next call, not remembered as "no such place". Keyed on the
+# token as well as the query so an explicit token is never answered from
+# another token's lookup; concurrent cold lookups of one key share a fetch
+# (services/keyed_locks). Callers get a deep copy, never the stored entry.
+_MAPBOX_CACHE: dict[tuple[str, str], tuple[float, list[dict]]] = {}
+_MAPBOX_CACHE_TTL_S = 24 * 60 * 60
+_MAPBOX_CACHE_MAX = 1024
+_MAPBOX_LOCKS: dict[tuple[str, str], asyncio.Lock] = {}
+
+
+def _mapbox_cache_get(key: tuple[str, str]) -> list[dict] | None:
+    hit = _MAPBOX_CACHE.get(key)
+    if hit is not None and time.monotonic() - hit[0] < _MAPBOX_CACHE_TTL_S:
+        return copy.deepcopy(hit[1])
+    return None
+
+
+async def _fetch_mapbox(query: str, tok: str, timeout_s: float) -> list[dict] | None:
+    """One Mapbox geocode, or None on any failure (so it isn't cached)."""
+    url = mapbox_geocode_url(query)
+    client = pooled_client("mapbox", httpx.AsyncClient)
+    try:
+        resp = await client.get(
+            url, params={"limit": 10, "access_token": tok}, timeout=timeout_s,
+        )
+        if not resp.is_success:
+            return None
+        data = resp.json()
+        return [
+            {
+                "id": f"mapbox-{f['id']}",
+                "name": f.get("text") or f.get("place_name", "").split(",")[0] or query,
+                "address": f.get("place_name"),
+                "center": {"lat": f["center"][1], "lng": f["center"][0]},
+                "source": "mapbox",
+            }
+            for f in data.get("features", [])
+        ]
+    except Exception:
+        return None
+
+
 async def search_mapbox(
     query: str, *, token: str | None = None, timeout_s: float = 8.0
 ) -> list[dict]:
@@ -358,22 +409,18 @@ async def search_mapbox(
     tok = token if token is not None else MAPBOX_TOKEN
     if not tok:
         return []
-    url = mapbox_geocode_url(query)
-    async with httpx.AsyncClient(timeout=timeout_s) as client:
-        try:
-            resp = await client.get(url, params={"limit": 10, "access_token": tok})
-            if not resp.is_success:
-                return []
-            data = resp.json()
-            return [
-                {
-                    "id": f"mapbox-{f['id']}",
-                    "name": f.get("text") or f.get("place_name", "").split(",")[0] or query,
-                    "address": f.get("place_name"),
-                    "center": {"lat": f["center"][1], "lng": f["center"][0]},
-                    "source": "mapbox",
-                }
-                for f in data.get("features", [])
-            ]
-        except Exception:
+    key = (tok, " ".join(query.lower().split()))
+    hit = _mapbox_cache_get(key)
+    if hit is not None:
+        return hit
+    async with keyed_lock(_MAPBOX_LOCKS, key):
+        hit = _mapbox_cache_get(key)
+        if hit is not None:
+            return hit
+        results = await _fetch_mapbox(query, tok, timeout_s)
+        if results is None:
             return []
+        if key not in _MAPBOX_CACHE and len(_MAPBOX_CACHE) >= _MAPBOX_CACHE_MAX:
+            _MAPBOX_CACHE.pop(min(_MAPBOX_CACHE, key=lambda k: _MAPBOX_CACHE[k][0]))
+        _MAPBOX_CACHE[key] = (time.monotonic(), results)
+        return copy.deepcopy(results)
@@ -29,6 +29,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from app.services.course_spatial import parse_leading_int_ref
+from app.services.http_clients import pooled_client
 
 # DB imports are lazy (inside fetch_elevation_cached) so that the pure
 # functions in this module — compute_hole_elevation_profile,
@@ -65,6 +66,12 @@ def _quantize(lat: float, lng: float) -> tuple[int, int]:
     return int(round(lat * _CACHE_PRECISION)), int(round(lng * _CACHE_PRECISION))
 
 
+# A cold hole in /course-intel fans out to ~11 point queries (tee, green, 3x3
+# slope grid); the pooled client keeps the EPQS connection warm across them.
+def _epqs_client() -> httpx.AsyncClient:
+    return pooled_client("usgs_epqs", lambda: httpx.AsyncClient(timeout=10))
+
+
 async def fetch_elevation(lat: float, lng: float) -> Optional[float]:
     """Fetch elevation in feet for a single point from USGS EPQS (no cache)."""
     params = {
@@ -75,10 +82,9 @@ async def fetch_elevation(lat: float, lng: float) -> Optional[float]:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(USGS_EPQS_URL, params=params)
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _epqs_client().get(USGS_EPQS_URL, params=params)
+        resp.raise_for_status()
+        data = resp.json()
 
         value = data.get("value")
         if value is None:
@@ -0,0 +1,37 @@
+"""Pooled outbound httpx clients for hosts the request path hits repeatedly.
+
+`async with httpx.AsyncClient(...)` per call pays DNS + TCP + TLS to the same
+upstream (GolfAPI, Mapbox, USGS EPQS) on every request. A pooled client keeps
+those connections alive between requests.
+
+Clients are keyed by name AND the running event loop: httpx connections can't
+cross loops, and scripts/tests may `asyncio.run()` more than once per process.
+Single-worker uvicorn means one loop in production, so one client per name.
+"""
+
+import asyncio
+from typing import Callable
+
+import httpx
+
+_CLIENTS: dict[str, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def pooled_client(name: str, factory: Callable[[], httpx.AsyncClient]) -> httpx.AsyncClient:
+    """The shared client registered under `name` for the running loop,
+    built with `factory()` on first use."""
+    loop = asyncio.get_running_loop()
+    entry = _CLIENTS.get(name)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, factory())
+        _CLIENTS[name] = entry
+    return entry[1]
+
+
+async def close_pooled_clients() -> None:
+    """Close every client owned by the running loop (app shutdown)."""
+    loop = asyncio.get_running_loop()
+    for name, (owner, client) in list(_CLIENTS.items()):
+        if owner is loop:
+            del _CLIENTS[name]
+            await client.aclose()
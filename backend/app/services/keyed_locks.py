@@ -0,0 +1,39 @@
+"""Per-key asyncio locks that don't outlive their users.
+
+The in-process response caches (golf proxy, course-intel weather) coalesce
+concurrent misses for one key behind one asyncio.Lock. Tying the lock's
+lifetime to the cache entry leaks: a failed fetch caches nothing, so its lock
+was never evicted, and a free-text key (a search query) grew the lock dict
+without bound. `keyed_lock` counts the tasks holding or waiting on a key's
+lock and drops it when the last one leaves, so the dict only ever holds keys
+with a fetch in flight.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Hashable
+
+
+class _KeyLock(asyncio.Lock):
+    """An asyncio.Lock that knows how many tasks hold or await it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.users = 0
+
+
+@asynccontextmanager
+async def keyed_lock(locks: dict, key: Hashable) -> AsyncIterator[None]:
+    """Hold the lock for `key` in `locks`, creating it on first use and
+    removing it once no task holds or waits on it."""
+    lock = locks.get(key)
+    if lock is None:
+        lock = locks[key] = _KeyLock()
+    lock.users += 1
+    try:
+        async with lock:
+            yield
+    finally:
+        lock.users -= 1
+        if not lock.users and locks.get(key) is lock:
+            del locks[key]
@@ -138,6 +138,35 @@ async def _post_with_retry(
     return None  # exhausted both attempts (should be unreachable)
 
 
+# Single-flight for the interactive search queries: a cold /nearby or
+# /search-osm opened twice (double tap, two tabs, a view switch mid-fetch)
+# used to send two identical 1-10s Overpass POSTs against a rate-limited
+# public endpoint. Identical in-flight queries now share one upstream call.
+# No result cache here — the routes already cache positives per query/cell.
+_INFLIGHT: dict[tuple[str, float], "asyncio.Task[Optional[dict]]"] = {}
+
+
+async def _post_coalesced(
+    query: str, *, timeout_s: float, log_tag: str, **retry_kwargs
+) -> Optional[dict]:
+    """``_post_with_retry`` on a fresh client, shared by every caller that
+    asks for the same (whitespace-normalized) query while it is in flight.
+    ``shield`` keeps one caller's cancellation from cancelling the others'."""
+    key = (" ".join(query.split()), timeout_s)
+    task = _INFLIGHT.get(key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        async def _fetch() -> Optional[dict]:
+            async with httpx.AsyncClient(timeout=timeout_s) as client:
+                return await _post_with_retry(client, query, log_tag=log_tag, **retry_kwargs)
+
+        task = asyncio.ensure_future(_fetch())
+        _INFLIGHT[key] = task
+        task.add_done_callback(
+            lambda done: _INFLIGHT.pop(key) if _INFLIGHT.get(key) is done else None
+        )
+    return await asyncio.shield(task)
+
+
 # ── Pure geometry parsers (unit-testable, no I/O) ─────────────────────────────
 
 def _parse_way_to_polygon(geom: list[dict]) -> Optional[dict]:
@@ -425,6 +454,7 @@ def _parse_course_geometry_response(
 # Generic golf words dropped from a name query so the remaining significant words
 # drive the match (order-independent, qualifier-tolerant).
 _OSM_STOPWORDS = {"golf", "course", "club", "links", "cc", "gc", "the", "at", "and", "&", "-"}
+_OVERPASS_UNSAFE_RE = re.compile(r'["\'\\]')
 
 
 def osm_name_filter(name: str) -> str:
@@ -437,7 +467,7 @@ def osm_name_filter(name: str) -> str:
     the Overpass regex safe.
     """
     def _safe(s: str) -> str:
-        return re.sub(r'["\'\\]', "", s)
+        return _OVERPASS_UNSAFE_RE.sub("", s)
 
     words = [_safe(w) for w in name.split()]
     significant = [w for w in words if w and w.lower() not in _OSM_STOPWORDS]
@@ -524,10 +554,9 @@ out center;
 
     client_timeout = 5 if interactive else 10
     backoff_s = 0.5 if interactive else _RETRY_BACKOFF_S
-    async with httpx.AsyncClient(timeout=client_timeout) as client:
-        data = await _post_with_retry(
-            client, query, log_tag="search_golf_courses", backoff_s=backoff_s,
-        )
+    data = await _post_coalesced(
+        query, timeout_s=client_timeout, log_tag="search_golf_courses", backoff_s=backoff_s,
+    )
     if data is None:
         return []
 
@@ -584,8 +613,7 @@ out center;
 out geom;
 """
 
-    async with httpx.AsyncClient(timeout=30) as client:
-        data = await _post_with_retry(client, query, log_tag="search_osm_with_geometry")
+    data = await _post_coalesced(query, timeout_s=30, log_tag="search_osm_with_geometry")
     if data is None:
         return []
 
@@ -3,6 +3,8 @@
 import httpx
 import math
 
+from app.services.http_clients import pooled_client
+
 # Open-Meteo API (free, no key required)
 OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
 
@@ -12,6 +14,26 @@ STANDARD_PRESSURE_HPA = 1013.25
 STANDARD_ALTITUDE_FT = 0.0
 
 
+def _svp(t: float) -> float:
+    """Saturation vapor pressure in hPa at `t` degrees C (Magnus formula)."""
+    return 6.1078 * math.exp((17.27 * t) / (t + 237.3))
+
+
+# The standard-conditions side of the density ratio never changes; evaluate it
+# once at import instead of an extra exp() on every call.
+_STD_TEMP_C = (STANDARD_TEMP_F - 32) * 5 / 9
+_STD_TEMP_K = _STD_TEMP_C + 273.15
+_STD_VAPOR = 0.5 * _svp(_STD_TEMP_C)
+_STD_DRY = STANDARD_PRESSURE_HPA - _STD_VAPOR
+_STD_MASS = _STD_DRY * 28.97 + _STD_VAPOR * 18.02
+
+
+# Every cold course-intel build hits the same Open-Meteo host; the pooled client
+# keeps that connection warm instead of paying TCP + TLS per fetch.
+def _open_meteo_client() -> httpx.AsyncClient:
+    return pooled_client("open_meteo", lambda: httpx.AsyncClient(timeout=10))
+
+
 async def fetch_weather(lat: float, lng: float) -> dict:
     """Fetch current weather conditions for a golf course location.
 
@@ -36,10 +58,9 @@ async def fetch_weather(lat: float, lng: float) -> dict:
         "timezone": "auto",
     }
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(OPEN_METEO_URL, params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await _open_meteo_client().get(OPEN_METEO_URL, params=params)
+    resp.raise_for_status()
+    data = resp.json()
 
     current = data.get("current", {})
     return {
@@ -67,7 +88,6 @@ def compute_air_density_factor(
         >1.0 = denser air (ball goes shorter) - low altitude, cold, dry
     """
     temp_c = (temperature_f - 32) * 5 / 9
-    std_temp_c = (STANDARD_TEMP_F - 32) * 5 / 9
 
     # NOTE: no extra altitude→pressure adjustment is applied here. The caller
     # passes Open-Meteo `surface_pressure` (see fetch_weather), which is ALREADY
@@ -79,27 +99,19 @@ def compute_air_density_factor(
     # used to re-derive pressure.
     effective_pressure = pressure_hpa
 
-    # Saturation vapor pressure (Magnus formula)
-    def svp(t: float) -> float:
-        return 6.1078 * math.exp((17.27 * t) / (t + 237.3))
-
     # Air density proportional to pressure / temperature, adjusted for humidity
-    vapor_pressure = (humidity / 100.0) * svp(temp_c)
+    vapor_pressure = (humidity / 100.0) * _svp(temp_c)
     dry_pressure = effective_pressure - vapor_pressure
 
-    std_vapor = 0.5 * svp(std_temp_c)
-    std_dry = STANDARD_PRESSURE_HPA - std_vapor
-
     # Density ratio (dry air is denser than moist air at same P and T)
     temp_k = temp_c + 273.15
-    std_temp_k = std_temp_c + 273.15
 
     # rho = (Pd * Md + Pv * Mv) / (R * T)
-    # Simplified ratio:
+    # Simplified ratio against the precomputed standard (_STD_MASS, _STD_TEMP_K):
     density_ratio = (
         (dry_pressure * 28.97 + vapor_pressure * 18.02)
-        / (std_dry * 28.97 + std_vapor * 18.02)
-        * (std_temp_k / temp_k)
+        / _STD_MASS
+        * (_STD_TEMP_K / temp_k)
     )
 
     return density_ratio
@@ -108,6 +108,16 @@ class TestClassifyPinPosition:
         assert classify_pin_position(hole) == "green"
 
 
+    def test_far_death_does_not_mask_two_severe_close_red(self):
+        # Single-pass counting: a far death hazard seen first must not stop
+        # the severe-close count from reaching red.
+        hole = _make_hole(hazards=[
+            _water("back", severity="death", distance=18.0),
+            _water("right", severity="severe", distance=5.0),
+            _bunker("left", severity="severe", distance=4.0),
+        ])
+        assert classify_pin_position(hole) == "red"
+
 # ── compute_aim_point ─────────────────────────────────────────────────────────
 
 class TestComputeAimPoint:
@@ -10,6 +10,7 @@ Covers (plan §6):
   5. Cache-usage logging fires (stream) + SSE frames unchanged.
   6. The `system` list is what reaches the SDK (JSON + stream).
   7. Timeout/retry constructor args.
+  8. Step-aligned history window (keeps the history cache prefix stable).
 """
 
 import os
@@ -23,7 +24,7 @@ import pytest
 from app.caddie.green_geometry import GREEN_GROUNDING_RULE
 from app.caddie.hazards import BEND_GROUNDING_RULE, HAZARD_GROUNDING_RULE
 from app.caddie.physics import PHYSICS_GROUNDING_RULE
-from app.caddie.session import RoundSession
+from app.caddie.session import RoundSession, VoiceCaddieMessage
 from app.caddie.types import CaddiePersonality, VoiceCaddieRequest
 from app.caddie.voice_prompts import (
     CADDIE_HOUSE_REGISTER,
@@ -108,6 +109,66 @@ async def test_session_voice_prompt_system_is_two_block_list_with_breakpoint(mon
     assert messages[-1] == {"role": "user", "content": "what club?"}
 
 
+def test_history_window_start_holds_steady_across_turns():
+    # Past 20 messages the window start advances in 10-message steps, so the
+    # cached prefix survives several exchanges instead of sliding every turn.
+    def window(n):
+        history = [
+            VoiceCaddieMessage(role="user" if i % 2 == 0 else "assistant", content=str(i))
+            for i in range(n)
+        ]
+        return caddie_routes._history_messages(history)
+
+    assert [m["content"] for m in window(20)[:1]] == ["0"]
+    assert [m["content"] for m in window(28)[:1]] == ["0"]
+    assert [m["content"] for m in window(30)[:1]] == ["10"]
+    assert [m["content"] for m in window(38)[:1]] == ["10"]
+    assert all(window(n)[0]["role"] == "user" for n in range(2, 60, 2))
+    assert caddie_routes._history_messages([]) == []
+
+
+def test_client_history_window_is_size_bounded():
+    """The stateless orb's client-sent history: at most 10 messages, newest
+    kept first until the char budget runs out, long assistant replies clipped,
+    and the window still opens on a user turn."""
+    history = []
+    for i in range(8):
+        history += [
+            {"role": "user", "content": f"q{i} " + "y" * 1500},
+            {"role": "assistant", "content": "x" * 2000},
+        ]
+
+    messages = caddie_routes._client_history_messages(history)
+
+    assert messages[0]["role"] == "user"
+    assert messages[0]["content"].startswith("q6 ")
+    assert messages[-1]["role"] == "assistant"
+    assert all(
+        len(m["content"]) <= caddie_routes._CLIENT_HISTORY_ASSISTANT_CHARS + 1
+        for m in messages if m["role"] == "assistant"
+    )
+    assert sum(len(m["content"]) for m in messages) <= caddie_routes._CLIENT_HISTORY_CHAR_BUDGET
+
+    short = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hey"}]
+    assert caddie_routes._client_history_messages(short) == short
+
+    # One oversized newest message is clipped to the budget, not kept whole.
+    huge = caddie_routes._client_history_messages([{"role": "user", "content": "z" * 50_000}])
+    assert len(huge) == 1
+    assert len(huge[0]["content"]) <= caddie_routes._CLIENT_HISTORY_CHAR_BUDGET
+
+    # A null content is treated as empty rather than raising.
+    assert caddie_routes._client_history_messages([{"role": "user", "content": None}]) == [
+        {"role": "user", "content": ""}
+    ]
+
+    # Anthropic content blocks pass through untouched, not sliced as a string.
+    blocks = [{"type": "text", "text": "what club?"}]
+    assert caddie_routes._client_history_messages(
+        [{"role": "user", "content": blocks}, {"role": "assistant", "content": "8 iron"}]
+    ) == [{"role": "user", "content": blocks}, {"role": "assistant", "content": "8 iron"}]
+
+
 @pytest.mark.asyncio
 async def test_session_voice_prompt_stable_before_volatile_ordering(monkeypatch):
     session = RoundSession(round_id="round-1", user_id="user-1", current_hole=4)
@@ -335,7 +396,7 @@ async def test_voice_prompt_content_identical_to_old_template_modulo_order(monke
     assert _normalized_line_set(new_flat) == _normalized_line_set(old_flat)
 
 
-# ── Fakes for anthropic.AsyncAnthropic ──────────────────────────────────────
+# ── Fakes for services.anthropic_client ─────────────────────────────────────
 # (The non-streaming text mouths now consume the shared tool loop on the
 # ASYNC client — caddie-tool-loop-parity. A final message without a
 # `stop_reason` of "tool_use" ends the turn after one call, exactly like the
@@ -400,7 +461,7 @@ class _FakeTurnMessages:
 
 
 class _FakeTurnAnthropic:
-    """Stand-in for anthropic.AsyncAnthropic — captures constructor kwargs and
+    """Stand-in for anthropic_client(...) — captures constructor kwargs and
     the last instance's `.messages` so tests can assert on captured_kwargs."""
 
     last_instance: "_FakeTurnAnthropic | None" = None
@@ -448,7 +509,7 @@ def test_session_voice_logs_cache_usage_and_sends_system_list(monkeypatch, caplo
         text="Take the 7-iron.",
         usage=_FakeUsage(cache_read=100, cache_creation=0, input_tokens=20, output_tokens=9),
     )
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _FakeTurnAnthropic)
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _FakeTurnAnthropic)
 
     client = _make_client()
     with caplog.at_level("INFO", logger="looper.caddie"):
@@ -488,7 +549,7 @@ def test_voice_caddie_logs_cache_usage_and_sends_system_list(monkeypatch, caplog
         text="Nice shot.",
         usage=_FakeUsage(cache_read=0, cache_creation=250, input_tokens=15, output_tokens=6),
     )
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _FakeTurnAnthropic)
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _FakeTurnAnthropic)
 
     client = _make_client()
     with caplog.at_level("INFO", logger="looper.caddie"):
@@ -523,7 +584,7 @@ def test_session_voice_constructs_async_client_with_timeout_and_retries(monkeypa
     monkeypatch.setattr(caddie_routes.sessions, "append_message_pair", _fake_append_message_pair)
 
     _FakeTurnAnthropic.configure()
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _FakeTurnAnthropic)
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _FakeTurnAnthropic)
 
     client = _make_client()
     res = client.post(
@@ -566,7 +627,7 @@ async def test_sse_reply_constructs_async_client_with_timeout_and_retries(monkey
             captured["max_retries"] = max_retries
             self.messages = _FakeMessages()
 
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _FakeAsyncAnthropicWithRetries)
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _FakeAsyncAnthropicWithRetries)
 
     frames = [
         chunk
@@ -623,7 +684,7 @@ async def test_sse_reply_logs_cache_usage_and_frames_unchanged(monkeypatch, capl
         def __init__(self, api_key=None, timeout=None, max_retries=None):
             self.messages = fake_messages
 
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _FakeAsyncAnthropic)
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _FakeAsyncAnthropic)
 
     system_blocks = [
         {"type": "text", "text": "stable", "cache_control": {"type": "ephemeral"}},
@@ -322,6 +322,27 @@ async def test_oversized_tool_result_is_clipped_with_marker(monkeypatch):
     assert len(result["content"]) <= tool_loop_mod._TOOL_RESULT_MAX_CHARS + len("…[truncated]")
 
 
+async def test_history_breakpoint_marks_last_history_message_only():
+    history = [
+        {"role": "user", "content": "what's the wind?"},
+        {"role": "assistant", "content": "Ten into you."},
+        {"role": "user", "content": "and the green?"},
+    ]
+    client = _FakeClient([_tool_turn(args={"hole_number": 4}), _text_turn(["ok."])])
+    async for _evt in run_caddie_turn(client, "test-model", "sys", history, _stateless_ctx()):
+        pass
+
+    for call in client.calls:
+        sent = call["messages"]
+        assert sent[0] == history[0]
+        assert sent[1]["content"] == [{
+            "type": "text", "text": "Ten into you.", "cache_control": {"type": "ephemeral"},
+        }]
+        assert sent[2] == history[2]
+    # The caller's list is untouched — it is what the route persists.
+    assert history[1] == {"role": "assistant", "content": "Ten into you."}
+
+
 # ── _accepts_temperature (specs/caddie-advice-model-plan.md Step 2) ─────────
 
 
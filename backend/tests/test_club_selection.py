@@ -8,6 +8,7 @@ from app.caddie.club_selection import (
     canonical_club,
     normalize_club_distances,
     compute_adjustments,
+    format_club_distances,
     select_club,
     DEFAULT_CLUB_DISTANCES,
 )
@@ -163,6 +164,12 @@ class TestNormalizeClubDistances:
         assert result["pw"] == 130
 
 
+    def test_free_form_spelling_still_normalizes(self):
+        # Spellings outside the import-time key table (spacing/casing from
+        # voice or the model) still resolve through canonical_club.
+        raw = {"7 Iron": 160, "Sand-Wedge": 100, "3W": 230}
+        assert normalize_club_distances(raw) == {"7iron": 160, "sw": 100, "3wood": 230}
+
 # ── compute_adjustments ───────────────────────────────────────────────────────
 
 class TestComputeAdjustments:
@@ -332,9 +339,29 @@ class TestSelectClub:
         assert club == "7iron"
         assert dist == 160
 
+    def test_edited_bag_is_not_served_a_stale_sort(self):
+        # The sorted-bag memo is keyed on the bag's contents, so a player
+        # editing a club mid-round gets the new order immediately.
+        bag = self._standard_bag()
+        assert select_club(145, bag) == ("9iron", 140)
+        bag["9iron"] = 150
+        assert select_club(145, bag) == ("9iron", 150)
+
     def test_returns_tuple_of_two(self):
         result = select_club(150, DEFAULT_CLUB_DISTANCES)
         assert isinstance(result, tuple)
         assert len(result) == 2
         assert isinstance(result[0], str)
         assert isinstance(result[1], int)
+
+
+# ── format_club_distances — prompt context line ──────────────────────────────
+
+def test_format_club_distances_longest_first_skipping_unset():
+    bag = {"7iron": 160, "driver": 250, "hybrid": 0, "custom": 160, "pw": 120}
+    # Equal carries keep bag order; the unset hybrid is dropped; unknown keys
+    # display raw.
+    assert format_club_distances(bag) == (
+        "Driver: 250y, 7 Iron: 160y, custom: 160y, PW: 120y"
+    )
+    assert format_club_distances({}) == ""
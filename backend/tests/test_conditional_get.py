@@ -0,0 +1,45 @@
+"""services/conditional_get.py — content-hash ETag, 304 on a matching
+If-None-Match, full body otherwise."""
+
+from starlette.requests import Request
+
+from app.models import SavedPlayer
+from app.services.conditional_get import conditional_json
+
+
+def _request(if_none_match=None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def _player(**overrides) -> SavedPlayer:
+    fields = {"id": "p1", "name": "Mike", "createdAt": "2026-01-01", "updatedAt": "2026-01-01"}
+    return SavedPlayer(**{**fields, **overrides})
+
+
+def test_first_fetch_returns_body_with_etag():
+    resp = conditional_json(_request(), _player())
+
+    assert resp.status_code == 200
+    assert resp.body == _player().model_dump_json().encode()
+    assert resp.headers["etag"].startswith('"')
+    assert resp.headers["cache-control"] == "private, no-cache"
+
+
+def test_matching_if_none_match_is_304_without_body():
+    etag = conditional_json(_request(), _player()).headers["etag"]
+
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        resp = conditional_json(_request(header), _player())
+        assert resp.status_code == 304
+        assert resp.body == b""
+        assert resp.headers["etag"] == etag
+
+
+def test_changed_resource_gets_new_etag_and_body():
+    etag = conditional_json(_request(), _player()).headers["etag"]
+
+    resp = conditional_json(_request(etag), _player(name="Michael"))
+
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
@@ -101,3 +101,30 @@ async def test_none_inputs_never_throw_and_stay_honest():
     assert intel.par == 4
     assert intel.handicap_rating == 9
     assert intel.elevation_change_ft == 0.0
+
+
+@pytest.mark.asyncio
+async def test_failed_slope_lookup_keeps_elevation(monkeypatch):
+    """The tee/green/slope lookups run concurrently; one leg raising degrades
+    that leg to None instead of discarding the legs that succeeded."""
+    async def fake_elev(lat, lng):
+        return 96.0 if lat < 40.746 else 125.4
+
+    async def broken_slope(green):
+        raise RuntimeError("3DEP down")
+
+    monkeypatch.setattr(course_intel, "fetch_elevation_cached", fake_elev)
+    monkeypatch.setattr(course_intel, "compute_green_slope", broken_slope)
+
+    intel = await course_intel.build_hole_intelligence(
+        hole_coords={
+            "holeNumber": 1,
+            "tee": {"lat": 40.7458939, "lng": -73.4507039},
+            "green": {"lat": 40.7496381, "lng": -73.4520769},
+        },
+        par=4,
+        yards=412,
+    )
+
+    assert intel.elevation_change_ft == pytest.approx(29.4, abs=0.1)
+    assert intel.green_slope is None
@@ -2,6 +2,7 @@
 OSM name-filter construction + course-search-v2 (Places/GolfAPI fan-out,
 non-blocking OSM enrichment, leg-health observability, cache-poisoning fix)."""
 
+import asyncio
 import logging
 from unittest.mock import AsyncMock, patch
 
@@ -73,6 +74,73 @@ def test_mapbox_url_normal_query_unaffected():
     assert course_search._mapbox_geocode_url("pebble").endswith("/mapbox.places/pebble.json")
 
 
+async def test_mapbox_geocode_is_cached_per_normalized_query(monkeypatch):
+    calls = []
+
+    class _Resp:
+        def __init__(self, ok):
+            self.is_success = ok
+
+        def json(self):
+            return {"features": [{"id": "1", "text": "Farmingdale", "center": [-73.4, 40.7]}]}
+
+    class _Client:
+        ok = False
+
+        async def get(self, url, **kwargs):
+            calls.append(url)
+            return _Resp(self.ok)
+
+    client = _Client()
+    monkeypatch.setattr(course_finder, "pooled_client", lambda name, factory: client)
+    monkeypatch.setattr(course_finder, "_MAPBOX_CACHE", {})
+
+    # A failed lookup is not remembered.
+    assert await course_finder.search_mapbox("Farmingdale NY", token="t") == []
+    client.ok = True
+    first = await course_finder.search_mapbox("Farmingdale NY", token="t")
+    again = await course_finder.search_mapbox("  farmingdale   ny ", token="t")
+
+    assert first == again
+    assert first[0]["center"] == {"lat": 40.7, "lng": -73.4}
+    assert len(calls) == 2
+
+
+async def test_mapbox_cache_coalesces_keys_on_token_and_hands_out_copies(monkeypatch):
+    calls = []
+
+    class _Resp:
+        is_success = True
+
+        def json(self):
+            return {"features": [{"id": "1", "text": "Bethpage", "center": [-73.4, 40.7]}]}
+
+    class _Client:
+        async def get(self, url, **kwargs):
+            calls.append(kwargs["params"]["access_token"])
+            await asyncio.sleep(0)
+            return _Resp()
+
+    monkeypatch.setattr(course_finder, "pooled_client", lambda name, factory: _Client())
+    monkeypatch.setattr(course_finder, "_MAPBOX_CACHE", {})
+    monkeypatch.setattr(course_finder, "_MAPBOX_LOCKS", {})
+
+    cold = await asyncio.gather(
+        *(course_finder.search_mapbox("Bethpage", token="a") for _ in range(3))
+    )
+    assert calls == ["a"]
+    assert course_finder._MAPBOX_LOCKS == {}
+
+    # A caller mutating its result doesn't touch the cached entry.
+    cold[0][0]["center"]["lat"] = 0.0
+    cold[0].clear()
+    assert (await course_finder.search_mapbox("Bethpage", token="a"))[0]["center"]["lat"] == 40.7
+
+    # Another token is its own lookup.
+    await course_finder.search_mapbox("Bethpage", token="b")
+    assert calls == ["a", "b"]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # search_courses pipeline — local-first, relevance-gated, cached, write-through
 #
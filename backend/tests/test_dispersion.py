@@ -99,6 +99,17 @@ class TestGetDispersion:
         result = get_dispersion("driver", handicap=10)
         assert result["center_bias"] == "none"
 
+    def test_lookup_matches_interpolation_at_fractional_handicaps(self):
+        # The import-time per-integer table must reproduce the breakpoint
+        # interpolation exactly, including between integer rows.
+        table = _DISPERSION_BY_CLUB_AND_HANDICAP["driver"]
+        for hcp in (0.4, 2.5, 7.3, 12.75, 29.9):
+            width, depth, short_bias = _interpolate_handicap(table, hcp)
+            result = get_dispersion("driver", handicap=hcp)
+            assert result["width_yards"] == round(width, 1)
+            assert result["depth_yards"] == round(depth, 1)
+            assert result["short_bias_pct"] == round(short_bias, 1)
+
     def test_rounded_values(self):
         # round(..., 1) applied — no 4-decimal float noise
         result = get_dispersion("driver", handicap=7)
@@ -0,0 +1,93 @@
+"""golf_proxy's in-process response cache — one upstream call per
+(action, id, q) within the TTL; upstream errors are never cached."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.routes import golf
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    golf._PROXY_CACHE.clear()
+    golf._PROXY_LOCKS.clear()
+    yield
+    golf._PROXY_CACHE.clear()
+    golf._PROXY_LOCKS.clear()
+
+
+async def test_concurrent_requests_share_one_upstream_call(monkeypatch):
+    calls: list[tuple] = []
+
+    async def _fake_fetch(action, q, id):
+        calls.append((action, q, id))
+        await asyncio.sleep(0)
+        return {"holeData": [{"hole": 1}]}
+
+    monkeypatch.setattr(golf, "_fetch_normalized", _fake_fetch)
+
+    responses = await asyncio.gather(
+        *(golf.golf_proxy(action="coordinates", q=None, id="42") for _ in range(3))
+    )
+    await golf.golf_proxy(action="coordinates", q=None, id="42")
+    await golf.golf_proxy(action="course", q=None, id="42")
+
+    assert calls == [("coordinates", None, "42"), ("course", None, "42")]
+    assert all(r.body == responses[0].body for r in responses)
+    assert responses[0].headers["cache-control"] == "public, max-age=86400"
+    assert golf._PROXY_LOCKS == {}
+
+
+async def test_upstream_error_is_not_cached(monkeypatch):
+    calls = 0
+
+    async def _failing_fetch(action, q, id):
+        nonlocal calls
+        calls += 1
+        raise HTTPException(503, "GolfAPI error: 503")
+
+    monkeypatch.setattr(golf, "_fetch_normalized", _failing_fetch)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            await golf.golf_proxy(action="search", q="pebble", id=None)
+    assert calls == 2
+    assert golf._PROXY_CACHE == {}
+    assert golf._PROXY_LOCKS == {}
+
+
+async def test_id_actions_ignore_stray_q(monkeypatch):
+    calls: list[tuple] = []
+
+    async def _fake_fetch(action, q, id):
+        calls.append((action, q, id))
+        return {"holeData": []}
+
+    monkeypatch.setattr(golf, "_fetch_normalized", _fake_fetch)
+
+    for junk in ("a", "b", None):
+        await golf.golf_proxy(action="course", q=junk, id="42")
+    await golf.golf_proxy(action="search", q="pebble", id="7")
+
+    assert calls == [("course", None, "42"), ("search", "pebble", None)]
+    assert set(golf._PROXY_CACHE) == {("course", "42", None), ("search", None, "pebble")}
+    assert golf._PROXY_LOCKS == {}
+
+
+async def test_expired_entry_refetches(monkeypatch):
+    calls = 0
+
+    async def _fake_fetch(action, q, id):
+        nonlocal calls
+        calls += 1
+        return {"clubs": [], "apiRequestsLeft": 10}
+
+    monkeypatch.setattr(golf, "_fetch_normalized", _fake_fetch)
+
+    await golf.golf_proxy(action="search", q="pebble", id=None)
+    stamp, data = golf._PROXY_CACHE[("search", None, "pebble")]
+    golf._PROXY_CACHE[("search", None, "pebble")] = (stamp - 3601, data)
+    await golf.golf_proxy(action="search", q="pebble", id=None)
+    assert calls == 2
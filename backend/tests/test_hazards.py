@@ -18,6 +18,8 @@ from app.caddie.hazards import (
     HAZARD_GROUNDING_RULE,
     TREE_RUN_SPLIT_GAP_YDS,
     _TREE_NEAR_TEE_SUPPRESS_YDS,
+    _xy_m,
+    _xy_m_many,
     extract_hole_bend,
     extract_hole_hazards,
     format_hazards_line,
@@ -722,6 +724,17 @@ class TestPolylineClassification:
         ]
 
 
+    def test_batch_projection_matches_single_point_projection(self):
+        """`_xy_m_many` is the observation-pass fast path — it must produce
+        the exact same local metres as `_xy_m`, point for point."""
+        points = [
+            _point_north_east(_TEE_LON, _TEE_LAT, n, e)
+            for n, e in ((0, 0), (120, -35), (260, 40), (410, 5), (-30, 12))
+        ]
+        assert _xy_m_many(_TEE_LAT, _TEE_LON, points) == [
+            _xy_m(_TEE_LAT, _TEE_LON, lat, lon) for lon, lat in points
+        ]
+
 # ── format_hazards_line ───────────────────────────────────────────────────────
 
 
@@ -0,0 +1,40 @@
+"""services/http_clients.py — pooled clients are per (name, event loop)."""
+
+import asyncio
+
+import httpx
+
+from app.services import http_clients
+from app.services.anthropic_client import anthropic_client
+
+
+async def test_same_name_reuses_client_and_shutdown_closes_it():
+    a = http_clients.pooled_client("t-reuse", httpx.AsyncClient)
+    assert http_clients.pooled_client("t-reuse", httpx.AsyncClient) is a
+    assert http_clients.pooled_client("t-other", httpx.AsyncClient) is not a
+
+    await http_clients.close_pooled_clients()
+    assert a.is_closed
+    assert "t-reuse" not in http_clients._CLIENTS
+
+
+def test_new_event_loop_gets_a_new_client():
+    async def _get():
+        return http_clients.pooled_client("t-loop", httpx.AsyncClient)
+
+    first = asyncio.run(_get())
+    second = asyncio.run(_get())
+    assert first is not second
+
+
+async def test_anthropic_clients_share_one_pool_closed_on_shutdown():
+    first = anthropic_client("key-a")
+    second = anthropic_client("key-b", timeout=5.0, max_retries=1)
+    pool = http_clients._CLIENTS["anthropic"][1]
+
+    assert first.api_key == "key-a" and second.api_key == "key-b"
+    assert second.timeout == 5.0 and second.max_retries == 1
+    assert http_clients.pooled_client("anthropic", httpx.AsyncClient) is pool
+
+    await http_clients.close_pooled_clients()
+    assert pool.is_closed
@@ -9,16 +9,19 @@ Coverage:
 - _post_with_retry: 429/5xx first then 200 → retry fires once, returns parsed data
 - _post_with_retry: clean 200 with empty elements → no retry, one HTTP call
 - _post_with_retry: httpx.TimeoutException → treated as transient, retried once
+- _post_coalesced: identical in-flight queries share one upstream POST
 - _should_abort_empty: 0 holes → True (abort); ≥1 holes → False (proceed)
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
+from app.services import osm
 from app.services.osm import _post_with_retry
 from app.services.osm_ingest import _should_abort_empty
 
@@ -241,6 +244,36 @@ class TestPostWithRetryExceptions:
         assert any("exc_test" in r.message for r in caplog.records)
 
 
+# ── _post_coalesced ───────────────────────────────────────────────────────────
+
+class TestPostCoalesced:
+    """Identical queries in flight together share one Overpass POST; a later
+    call (after the first finished) goes upstream again."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_queries_share_one_post(self, monkeypatch):
+        calls: list[str] = []
+
+        async def _fake_post(client, query, log_tag="Overpass", **kwargs):
+            calls.append(query)
+            await asyncio.sleep(0)
+            return {"elements": [{"id": len(calls)}]}
+
+        monkeypatch.setattr(osm, "_post_with_retry", _fake_post)
+
+        results = await asyncio.gather(
+            osm._post_coalesced("[out:json];\n  way;", timeout_s=5, log_tag="t"),
+            osm._post_coalesced("[out:json]; way;", timeout_s=5, log_tag="t"),
+            osm._post_coalesced("[out:json]; relation;", timeout_s=5, log_tag="t"),
+        )
+        assert len(calls) == 2
+        assert results[0] is results[1]
+        assert osm._INFLIGHT == {}
+
+        await osm._post_coalesced("[out:json]; way;", timeout_s=5, log_tag="t")
+        assert len(calls) == 3
+
+
 # ── _should_abort_empty ───────────────────────────────────────────────────────
 
 class TestShouldAbortEmpty:
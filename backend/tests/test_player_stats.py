@@ -0,0 +1,73 @@
+"""analyze_player_stats: scoring distribution and par averages from raw rounds."""
+
+import pytest
+
+from app.caddie.player_stats import analyze_player_stats, get_hole_history
+from app.caddie.types import PlayerStatistics
+
+
+def _round(pars_and_strokes):
+    return {
+        "holes": [{"number": i, "par": par} for i, (par, _) in enumerate(pars_and_strokes, 1)],
+        "scores": [
+            {"holeNumber": i, "strokes": strokes}
+            for i, (_, strokes) in enumerate(pars_and_strokes, 1)
+        ],
+    }
+
+
+def test_distribution_clamps_end_buckets_and_averages_by_par():
+    rnd = _round([
+        (5, 3),   # albatross -> eagles bucket
+        (4, 3),   # birdie
+        (4, 4),   # par
+        (3, 4),   # bogey
+        (5, 7),   # double
+        (4, 9),   # quintuple -> triples_plus bucket
+        (4, None),  # unscored hole is skipped
+    ])
+
+    stats = analyze_player_stats([rnd], handicap=12)
+
+    dist = stats.scoring_distribution
+    for bucket in ("eagles", "birdies", "pars", "bogeys", "doubles", "triples_plus"):
+        assert getattr(dist, bucket) == pytest.approx(16.7)
+    assert stats.par_averages.par3 == 4.0
+    assert stats.par_averages.par4 == pytest.approx(16 / 3)
+    assert stats.par_averages.par5 == 5.0
+    assert stats.tendencies.doubles_per_round == 2.0
+    assert stats.tendencies.par5_bogey_rate == 50.0
+
+
+def test_rounds_without_scored_holes_fall_back_to_defaults():
+    rnd = _round([(4, None)])
+
+    stats = analyze_player_stats([rnd], handicap=8)
+
+    assert stats.rounds_analyzed == 0
+
+
+def test_hole_history_counts_only_the_requested_course_and_hole():
+    played = _round([(4, 5), (3, 2), (5, 5)])
+    played["courseId"] = "bethpage"
+    elsewhere = _round([(4, 9), (3, 9)])
+    elsewhere["courseId"] = "other"
+
+    history = get_hole_history([played, played, elsewhere], "bethpage", 2)
+
+    assert history.times_played == 2
+    assert history.avg_score == 2.0
+    assert history.birdie_rate == 100.0
+    assert history.bogey_rate == 0.0
+    assert get_hole_history([elsewhere], "bethpage", 2) is None
+
+
+@pytest.mark.parametrize("handicap", [None, 0, 8, 12.4, 30])
+def test_constructed_stats_survive_full_validation_unchanged(handicap):
+    # The models are built with model_construct; a schema change that makes
+    # any field disagree with what validation would produce must fail here.
+    played = _round([(4, 5), (3, 3), (5, 7), (4, 4)])
+    for rounds in ([played], [], [_round([(4, None)])]):
+        stats = analyze_player_stats(rounds, handicap=handicap)
+        revalidated = PlayerStatistics.model_validate(stats.model_dump())
+        assert revalidated.model_dump_json() == stats.model_dump_json()
@@ -171,7 +171,7 @@ def _fake_run_strategy_turn(strategy_text: str, calls: list):
 async def test_session_voice_advice_ask_routes_to_brain_and_never_calls_claude(monkeypatch):
     session = _session()
     client = _client(monkeypatch, session)
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _PoisonedAnthropic)
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _PoisonedAnthropic)
     calls: list = []
     monkeypatch.setattr(
         caddie_routes, "run_strategy_turn", _fake_run_strategy_turn("Hit driver, aim center, commit.", calls)
@@ -193,7 +193,7 @@ async def test_session_voice_advice_ask_routes_to_brain_and_never_calls_claude(m
 async def test_session_voice_fact_ask_stays_on_claude_loop(monkeypatch):
     session = _session()
     client = _client(monkeypatch, session)
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _FakeClaudeAnthropic)
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _FakeClaudeAnthropic)
     calls: list = []
     monkeypatch.setattr(caddie_routes, "run_strategy_turn", _fake_run_strategy_turn("SHOULD NEVER BE SPOKEN", calls))
 
@@ -218,7 +218,7 @@ async def test_session_voice_fact_ask_stays_on_claude_loop(monkeypatch):
 async def test_session_voice_score_ask_returns_honest_handoff_line_and_never_calls_brain(monkeypatch):
     session = _session()
     client = _client(monkeypatch, session)
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _PoisonedAnthropic)
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _PoisonedAnthropic)
     calls: list = []
     monkeypatch.setattr(caddie_routes, "run_strategy_turn", _fake_run_strategy_turn("SHOULD NEVER BE SPOKEN", calls))
 
@@ -238,7 +238,7 @@ async def test_session_voice_score_ask_returns_honest_handoff_line_and_never_cal
 async def test_advice_turn_persists_message_pair_like_normal_turns(monkeypatch):
     session = _session()
     client = _client(monkeypatch, session)
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _PoisonedAnthropic)
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _PoisonedAnthropic)
     calls: list = []
     monkeypatch.setattr(
         caddie_routes, "run_strategy_turn", _fake_run_strategy_turn("Hit driver, aim center, commit.", calls)
@@ -283,7 +283,7 @@ def _parse_sse(body: str) -> list[tuple[str, object]]:
 async def test_session_voice_stream_advice_emits_reading_the_hole_status_then_brain_text(monkeypatch):
     session = _session()
     client = _client(monkeypatch, session)
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _PoisonedAnthropic)
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _PoisonedAnthropic)
     calls: list = []
     monkeypatch.setattr(
         caddie_routes, "run_strategy_turn", _fake_run_strategy_turn("Hit driver, aim center, commit.", calls)
@@ -32,7 +32,7 @@ from app.routes import caddie as caddie_routes
 from app.services.clerk_auth import current_user_id
 
 
-# ── Fakes for anthropic.AsyncAnthropic ──────────────────────────────────────
+# ── Fakes for services.anthropic_client ─────────────────────────────────────
 
 
 class _FakeMessageUsage:
@@ -92,7 +92,7 @@ class _FakeMessages:
 
 
 class _FakeAsyncAnthropic:
-    """Stand-in for anthropic.AsyncAnthropic — captures the last instance's
+    """Stand-in for anthropic_client(...) — captures the last instance's
     `.messages` so tests can assert on captured_kwargs."""
 
     last_messages: "_FakeMessages | None" = None
@@ -145,7 +145,7 @@ def _parse_sse(frames: list[str]) -> list[tuple[str, object]]:
 
 @pytest.mark.asyncio
 async def test_sse_reply_emits_token_per_delta_then_done(monkeypatch):
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _make_fake_anthropic(["Easy ", "7-iron."]))
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _make_fake_anthropic(["Easy ", "7-iron."]))
 
     frames = await _collect(
         caddie_routes._sse_reply(
@@ -159,7 +159,7 @@ async def test_sse_reply_emits_token_per_delta_then_done(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_sse_reply_uses_identical_model_params(monkeypatch):
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _make_fake_anthropic(["hi"]))
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _make_fake_anthropic(["hi"]))
     monkeypatch.setenv("ANTHROPIC_MODEL", "claude-sonnet-4-5-20250929")
 
     await _collect(
@@ -177,7 +177,7 @@ async def test_sse_reply_advice_model_env_outranks_anthropic_model(monkeypatch):
     """specs/caddie-advice-model-plan.md Step 1 — `CADDIE_ADVICE_MODEL` is the
     dedicated env for the text advice mouths and outranks the shared
     `ANTHROPIC_MODEL` when both are set."""
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _make_fake_anthropic(["hi"]))
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _make_fake_anthropic(["hi"]))
     monkeypatch.setenv("ANTHROPIC_MODEL", "claude-opus-4-20250514")
     monkeypatch.setenv("CADDIE_ADVICE_MODEL", "claude-sonnet-5")
 
@@ -193,7 +193,7 @@ async def test_sse_reply_advice_model_off_allowlist_omits_temperature(monkeypatc
     """specs/caddie-advice-model-plan.md Step 2 — a model outside the
     conservative allowlist (e.g. `claude-sonnet-5`) must never 400 on
     `temperature`, so it's simply omitted from the call kwargs."""
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _make_fake_anthropic(["hi"]))
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _make_fake_anthropic(["hi"]))
     monkeypatch.setenv("CADDIE_ADVICE_MODEL", "claude-sonnet-5")
 
     await _collect(
@@ -204,12 +204,44 @@ async def test_sse_reply_advice_model_off_allowlist_omits_temperature(monkeypatc
     assert "temperature" not in kwargs
 
 
+def test_turn_model_routes_only_other_intent_to_chat_model(monkeypatch):
+    """Chit-chat drops to the cheap chat model; judgment and numbers stay on
+    the advice model. `_chat_model` does NOT inherit ANTHROPIC_MODEL."""
+    monkeypatch.setenv("ANTHROPIC_MODEL", "claude-opus-4-20250514")
+    monkeypatch.delenv("CADDIE_ADVICE_MODEL", raising=False)
+    monkeypatch.delenv("CADDIE_CHAT_MODEL", raising=False)
+
+    assert caddie_routes._turn_model("thanks buddy") == "claude-haiku-4-5"
+    assert caddie_routes._turn_model("what club should I hit") == "claude-opus-4-20250514"
+    assert caddie_routes._turn_model("how far to the green") == "claude-opus-4-20250514"
+    # The session mouths route their own classified intent through the same rule.
+    assert caddie_routes._model_for_intent(caddie_routes.Intent.OTHER) == "claude-haiku-4-5"
+    assert caddie_routes._model_for_intent(caddie_routes.Intent.FACT) == "claude-opus-4-20250514"
+
+    monkeypatch.setenv("CADDIE_CHAT_MODEL", "claude-haiku-4-6")
+    assert caddie_routes._turn_model("thanks buddy") == "claude-haiku-4-6"
+
+
+@pytest.mark.asyncio
+async def test_sse_reply_uses_caller_model(monkeypatch):
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _make_fake_anthropic(["hi"]))
+    monkeypatch.setenv("CADDIE_ADVICE_MODEL", "claude-sonnet-5")
+
+    await _collect(
+        caddie_routes._sse_reply(
+            "fake-key", "sys", [{"role": "user", "content": "x"}],
+            log_context="test", model="claude-haiku-4-5",
+        )
+    )
+    assert _FakeAsyncAnthropic.last_messages.captured_kwargs["model"] == "claude-haiku-4-5"
+
+
 @pytest.mark.asyncio
 async def test_sse_reply_constructs_client_with_timeout_and_retries(monkeypatch):
     """specs/caddie-prompt-caching-text-path-plan.md §3 (folded
     caddie-llm-timeouts-retries item) — bounded timeout + one SDK-native
     retry on the async client used by every streaming reply."""
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _make_fake_anthropic(["hi"]))
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _make_fake_anthropic(["hi"]))
 
     await _collect(
         caddie_routes._sse_reply("fake-key", "sys", [{"role": "user", "content": "x"}], log_context="test")
@@ -221,7 +253,7 @@ async def test_sse_reply_constructs_client_with_timeout_and_retries(monkeypatch)
 
 @pytest.mark.asyncio
 async def test_sse_reply_session_flavor_persists_complete_text(monkeypatch):
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _make_fake_anthropic(["Take the ", "8-iron."]))
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _make_fake_anthropic(["Take the ", "8-iron."]))
     captured = {}
 
     async def _fake_append_message_pair(round_id, user_content, assistant_content, hole_number=None):
@@ -248,7 +280,7 @@ async def test_sse_reply_session_flavor_persists_complete_text(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_sse_reply_stateless_flavor_never_persists(monkeypatch):
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _make_fake_anthropic(["Nice shot."]))
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _make_fake_anthropic(["Nice shot."]))
     append_spy_called = False
 
     async def _fake_append_message_pair(*args, **kwargs):
@@ -269,7 +301,7 @@ async def test_sse_reply_stateless_flavor_never_persists(monkeypatch):
 async def test_sse_reply_mid_stream_error_yields_single_calm_error_and_never_persists(monkeypatch):
     boom = RuntimeError("some internal traceback detail — never leak this")
     monkeypatch.setattr(
-        caddie_routes.anthropic, "AsyncAnthropic", _make_fake_anthropic(["Partial "], exc=boom)
+        caddie_routes, "anthropic_client", _make_fake_anthropic(["Partial "], exc=boom)
     )
     append_spy_called = False
 
@@ -307,7 +339,7 @@ def _make_auth_error() -> Exception:
 @pytest.mark.asyncio
 async def test_sse_reply_auth_error_yields_calm_error(monkeypatch):
     monkeypatch.setattr(
-        caddie_routes.anthropic, "AsyncAnthropic", _make_fake_anthropic([], exc=_make_auth_error())
+        caddie_routes, "anthropic_client", _make_fake_anthropic([], exc=_make_auth_error())
     )
 
     frames = await _collect(
@@ -319,7 +351,7 @@ async def test_sse_reply_auth_error_yields_calm_error(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_sse_reply_empty_stream_persists_and_sends_fallback(monkeypatch):
-    monkeypatch.setattr(caddie_routes.anthropic, "AsyncAnthropic", _make_fake_anthropic([]))
+    monkeypatch.setattr(caddie_routes, "anthropic_client", _make_fake_anthropic([]))
     captured = {}
 
     async def _fake_append_message_pair(round_id, user_content, assistant_content, hole_number=None):